@@ -4,153 +4,180 @@ ASCII Art Banner Module for Pr0Xy-chaIN
 Displays unique banner with tool name and author info
 """
 
+import functools
+import os
 import random
+import re
+import sys
 import time
 from datetime import datetime
+from types import MappingProxyType
+
+# ANSI escape sequences shared by every banner (read-only)
+_C = MappingProxyType({
+    'red': '\033[91m',
+    'green': '\033[92m',
+    'yellow': '\033[93m',
+    'blue': '\033[94m',
+    'magenta': '\033[95m',
+    'cyan': '\033[96m',
+    'white': '\033[97m',
+    'reset': '\033[0m',
+    'bold': '\033[1m',
+    'dim': '\033[2m'
+})
+
+_SGR_RUN = re.compile(r'(?:\x1b\[[0-9;]*m)+')
+
+def _merge_sgr(text):
+    """Collapse each run of adjacent SGR escapes into a single sequence"""
+    def merge(match):
+        params = []
+        for code in match.group(0)[2:-1].split('m\x1b['):
+            for param in code.split(';'):
+                param = param or '0'
+                if param == '0':
+                    # A reset cancels everything before it in the run
+                    params = []
+                if param not in params:
+                    params.append(param)
+        return '\x1b[' + ';'.join(params) + 'm'
+    return _SGR_RUN.sub(merge, text)
+
+def _strip_ansi(text):
+    """Remove all SGR escapes, leaving the plain banner text"""
+    return _SGR_RUN.sub('', text)
+
+# Honour NO_COLOR and skip escapes entirely when stdout is not a terminal,
+# decided once so neither path pays any per-call cost
+_USE_COLOR = (sys.stdout is not None and sys.stdout.isatty()
+              and not os.environ.get('NO_COLOR'))
+
+def _render(text):
+    """Finalise a static banner for the current output mode"""
+    return _merge_sgr(text) if _USE_COLOR else _strip_ansi(text)
+
+# Banners are static, so build them once at import instead of on every call
+_BANNER = _render(
+    "\n" + _C['cyan'] + _C['bold'] + "\n"
+    "\n"
+    "    ██████╗ ██████╗  ██████╗ ██╗  ██╗██╗   ██╗      ██████╗██╗  ██╗ █████╗ ██╗███╗   ██╗\n"
+    "    ██╔══██╗██╔══██╗██╔═████╗╚██╗██╔╝╚██╗ ██╔╝     ██╔════╝██║  ██║██╔══██╗██║████╗  ██║\n"
+    "    ██████╔╝██████╔╝██║██╔██║ ╚███╔╝  ╚████╔╝█████╗██║     ███████║███████║██║██╔██╗ ██║\n"
+    "    ██╔═══╝ ██╔══██╗████╔╝██║ ██╔██╗   ╚██╔╝ ╚════╝██║     ██╔══██║██╔══██║██║██║╚██╗██║\n"
+    "    ██║     ██║  ██║╚██████╔╝██╔╝ ██╗   ██║        ╚██████╗██║  ██║██║  ██║██║██║ ╚████║\n"
+    "    ╚═╝     ╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═╝   ╚═╝         ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝╚═╝  ╚═══╝" + _C['reset'] + "\n"
+    "\n"
+    + _C['yellow'] + _C['bold'] + "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "    ▶▶▶  A D V A N C E D   P R O X Y   C H A I N   M A N A G E M E N T   S Y S T E M  ◀◀◀\n"
+    "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + _C['reset'] + "\n"
+    "\n"
+    + _C['green'] + _C['bold'] + "    🔗 Multi-Source Proxy Discovery     🔄 Intelligent Rotation System\n"
+    "    ⚡ Real-Time Validation Engine     🛠️  Seamless Tool Integration  \n"
+    "    📊 Background Daemon Service       🎯 One-Command Setup & Deploy" + _C['reset'] + "\n"
+    "\n"
+    + _C['cyan'] + _C['bold'] + "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "    " + _C['magenta'] + "Created by: " + _C['yellow'] + "Abhijeet Panda " + _C['dim'] + "(@trinity999)\n"
+    "    " + _C['magenta'] + "GitHub: " + _C['blue'] + "https://github.com/trinity999/Pr0Xy-chaIN\n"
+    "    " + _C['magenta'] + "Version: " + _C['green'] + "v1.0.0 " + _C['dim'] + "• Educational & Authorized Testing Only\n"
+    "    " + _C['cyan'] + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + _C['reset'] + "\n"
+    "\n"
+)
+
+_MINI_BANNER = _render(
+    "\n" + _C['cyan'] + _C['bold'] + "\n"
+    "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "    " + _C['yellow'] + "Pr0Xy-chaIN " + _C['white'] + "by Abhijeet Panda\n"
+    "    " + _C['white'] + "Advanced Proxy Management Tool\n"
+    "    " + _C['cyan'] + "━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + _C['reset'] + "\n"
+    "\n"
+)
+
+_SUCCESS_BANNER = _render(
+    "\n" + _C['green'] + _C['bold'] + "\n"
+    "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "    ✅ PROXY CHAIN INITIALIZED SUCCESSFULLY\n"
+    "    \n"
+    "    🚀 Ready for security testing!\n"
+    "    🔗 Proxy discovery in progress...\n"
+    "    \n"
+    "    Use: proxy-status to check progress\n"
+    "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + _C['reset'] + "\n"
+    "\n"
+)
+
+# The error banner wraps a caller-supplied message, so it is kept in two halves
+_ERROR_PREFIX = _render(
+    "\n" + _C['red'] + _C['bold'] + "\n"
+    "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "    ❌ ERROR OCCURRED\n"
+    "    \n"
+    "    "
+)
+_ERROR_SUFFIX = _render(
+    "\n"
+    "    \n"
+    "    Check logs for more details\n"
+    "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + _C['reset'] + "\n"
+    "\n"
+)
+
+_STATUS_HEADER = _render(
+    "\n" + _C['blue'] + _C['bold'] + "\n"
+    "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━\n"
+    "    🔗 PROXY CHAIN DAEMON STATUS 🔗\n"
+    "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + _C['reset'] + "\n"
+)
+
+_STATUS_FOOTER = _render(
+    "\n" + _C['blue'] + _C['bold'] + "    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━" + _C['reset'] + "\n"
+    "\n"
+)
+
+_LOADING_PREFIX = _render(_C['yellow'] + "[" + _C['white'] + "⚡" + _C['yellow'] + "] Initializing Pr0Xy-chaIN")
+_LOADING_DOT = "."
+_LOADING_SUFFIX = _render(" " + _C['green'] + "Ready!" + _C['reset'] + "\n\n")
 
 def print_banner():
     """Print the unique ASCII art banner for Pr0Xy-chaIN"""
-    
-    # Color codes for terminal (ANSI escape sequences)
-    colors = {
-        'red': '\033[91m',
-        'green': '\033[92m',
-        'yellow': '\033[93m',
-        'blue': '\033[94m',
-        'magenta': '\033[95m',
-        'cyan': '\033[96m',
-        'white': '\033[97m',
-        'reset': '\033[0m',
-        'bold': '\033[1m',
-        'dim': '\033[2m'
-    }
-    
-    # Modern borderless ASCII art design
-    banner = f"""
-{colors['cyan']}{colors['bold']}
-
-    ██████╗ ██████╗  ██████╗ ██╗  ██╗██╗   ██╗      ██████╗██╗  ██╗ █████╗ ██╗███╗   ██╗
-    ██╔══██╗██╔══██╗██╔═████╗╚██╗██╔╝╚██╗ ██╔╝     ██╔════╝██║  ██║██╔══██╗██║████╗  ██║
-    ██████╔╝██████╔╝██║██╔██║ ╚███╔╝  ╚████╔╝█████╗██║     ███████║███████║██║██╔██╗ ██║
-    ██╔═══╝ ██╔══██╗████╔╝██║ ██╔██╗   ╚██╔╝ ╚════╝██║     ██╔══██║██╔══██║██║██║╚██╗██║
-    ██║     ██║  ██║╚██████╔╝██╔╝ ██╗   ██║        ╚██████╗██║  ██║██║  ██║██║██║ ╚████║
-    ╚═╝     ╚═╝  ╚═╝ ╚═════╝ ╚═╝  ╚═╝   ╚═╝         ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝╚═╝  ╚═══╝{colors['reset']}
-
-{colors['yellow']}{colors['bold']}    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    ▶▶▶  A D V A N C E D   P R O X Y   C H A I N   M A N A G E M E N T   S Y S T E M  ◀◀◀
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{colors['reset']}
-
-{colors['green']}{colors['bold']}    🔗 Multi-Source Proxy Discovery     🔄 Intelligent Rotation System
-    ⚡ Real-Time Validation Engine     🛠️  Seamless Tool Integration  
-    📊 Background Daemon Service       🎯 One-Command Setup & Deploy{colors['reset']}
-
-{colors['cyan']}{colors['bold']}    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    {colors['magenta']}Created by: {colors['yellow']}Abhijeet Panda {colors['dim']}(@trinity999)
-    {colors['magenta']}GitHub: {colors['blue']}https://github.com/trinity999/Pr0Xy-chaIN
-    {colors['magenta']}Version: {colors['green']}v1.0.0 {colors['dim']}• Educational & Authorized Testing Only
-    {colors['cyan']}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{colors['reset']}
-"""
-    
-    print(banner)
+    write = sys.stdout.write
+    flush = sys.stdout.flush
+    write(_BANNER)
     
     # Add animated dots loading effect
-    print(f"{colors['yellow']}[{colors['white']}⚡{colors['yellow']}] Initializing Pr0Xy-chaIN", end="")
-    for i in range(3):
+    write(_LOADING_PREFIX)
+    flush()
+    for _ in range(3):
         time.sleep(0.3)
-        print(".", end="", flush=True)
-    print(f" {colors['green']}Ready!{colors['reset']}")
-    print()
+        write(_LOADING_DOT)
+        flush()
+    write(_LOADING_SUFFIX)
+    flush()
 
 def print_mini_banner():
     """Print a smaller version of the banner for quick commands"""
-    colors = {
-        'cyan': '\033[96m',
-        'yellow': '\033[93m',
-        'white': '\033[97m',
-        'reset': '\033[0m',
-        'bold': '\033[1m'
-    }
-    
-    mini_banner = f"""
-{colors['cyan']}{colors['bold']}
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    {colors['yellow']}Pr0Xy-chaIN {colors['white']}by Abhijeet Panda
-    {colors['white']}Advanced Proxy Management Tool
-    {colors['cyan']}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{colors['reset']}
-"""
-    print(mini_banner)
+    sys.stdout.write(_MINI_BANNER)
 
 def print_success_banner():
     """Print success banner after initialization"""
-    colors = {
-        'green': '\033[92m',
-        'white': '\033[97m',
-        'reset': '\033[0m',
-        'bold': '\033[1m'
-    }
-    
-    success = f"""
-{colors['green']}{colors['bold']}
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    ✅ PROXY CHAIN INITIALIZED SUCCESSFULLY
-    
-    🚀 Ready for security testing!
-    🔗 Proxy discovery in progress...
-    
-    Use: proxy-status to check progress
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{colors['reset']}
-"""
-    print(success)
+    sys.stdout.write(_SUCCESS_BANNER)
+
+@functools.lru_cache(maxsize=128)
+def _format_error(message):
+    """Wrap a message in the error banner (cached for repeated errors)"""
+    return _ERROR_PREFIX + message + _ERROR_SUFFIX
 
 def print_error_banner(message="Unknown Error"):
     """Print error banner"""
-    colors = {
-        'red': '\033[91m',
-        'white': '\033[97m',
-        'reset': '\033[0m',
-        'bold': '\033[1m'
-    }
-    
-    error = f"""
-{colors['red']}{colors['bold']}
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    ❌ ERROR OCCURRED
-    
-    {message}
-    
-    Check logs for more details
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{colors['reset']}
-"""
-    print(error)
+    sys.stdout.write(_format_error(str(message)))
 
 def print_status_header():
     """Print header for status display"""
-    colors = {
-        'blue': '\033[94m',
-        'white': '\033[97m',
-        'reset': '\033[0m',
-        'bold': '\033[1m'
-    }
-    
-    header = f"""
-{colors['blue']}{colors['bold']}
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    🔗 PROXY CHAIN DAEMON STATUS 🔗
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{colors['reset']}"""
-    print(header)
+    sys.stdout.write(_STATUS_HEADER)
 
 def print_status_footer():
     """Print footer for status display"""
-    colors = {
-        'blue': '\033[94m',
-        'reset': '\033[0m',
-        'bold': '\033[1m'
-    }
-    
-    footer = f"""
-{colors['blue']}{colors['bold']}    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{colors['reset']}
-"""
-    print(footer)
+    sys.stdout.write(_STATUS_FOOTER)
 
 def get_random_proxy_art():
     """Get random proxy-themed ASCII art"""
@@ -4,29 +4,169 @@ IMPROVED Proxy Chain Daemon Status Manager
 Enhanced with better process management, health checks, and error handling
 """
 
+import argparse
 import json
 import os
 import sys
 import subprocess
-import psutil
 import time
-import requests
+import functools
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
 from datetime import datetime, timedelta
+import mmap
+import re
 from pathlib import Path
+if os.name == 'nt':
+    import msvcrt
+    fcntl = None
+else:
+    import fcntl
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder if orjson is not installed
+    orjson = None
+
+# psutil and requests are imported where they are used, so actions that
+# never probe processes or the network don't pay to load them
+
+# Shared by every health probe so keep-alive connections to each proxy are
+# reused between checks instead of reconnecting per request
+_session = None
+
+def _get_session():
+    """Return the shared probe session, creating it on first use"""
+    global _session
+    if _session is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=0)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _session = session
+    return _session
+
+# Matches once per line that has anything besides whitespace
+_NON_BLANK_LINE = re.compile(rb'^[ \t\r\f\v]*\S', re.MULTILINE)
+
+def _dumps_status(status):
+    """Encode a status dict as indented JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(status, option=orjson.OPT_INDENT_2)
+    return json.dumps(status, indent=2).encode()
+
+def _loads_status(data):
+    """Decode status JSON bytes; both decoders raise json.JSONDecodeError"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=4)
+def _parse_iso(timestamp):
+    """datetime.fromisoformat, memoized; "started" only changes on restart"""
+    return datetime.fromisoformat(timestamp)
+
+def _pid_alive(pid):
+    """Cheap liveness check: a single kill(pid, 0) syscall instead of /proc reads"""
+    if os.name == 'nt':
+        # os.kill terminates the process on Windows, so ask psutil there
+        import psutil
+        return psutil.pid_exists(pid)
+    try:
+        os.kill(pid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # Exists but belongs to another user
+        return True
+
+class _StreamArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that writes help to `out` and usage errors to `err`
+    instead of the process-wide sys.stdout/sys.stderr"""
+    
+    def __init__(self, *args, out=None, err=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.out = out
+        self.err = err
+    
+    def _print_message(self, message, file=None):
+        stream = self.err if file is sys.stderr else self.out
+        super()._print_message(message, stream or file)
+
+def ttl_cached(seconds):
+    """Cache a manager method's result on the instance for `seconds`
+    
+    Repeat status/health calls inside the window return the stored value
+    instead of re-probing the network, /proc and the status file. The
+    instance's cache lock is held while computing, so two threads never run
+    the same check at once. Dict results are copied on the way out so
+    callers can annotate them without touching the cached copy.
+    
+    Only argument-less calls are cached: the result is keyed by method
+    name, and calls that pass pids or pre-gathered facts always run.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            if not self.use_cache or args or kwargs:
+                return method(self, *args, **kwargs)
+            key = method.__name__
+            with self._cache_lock:
+                entry = self._cache.get(key)
+                if entry is None or time.monotonic() >= entry[0]:
+                    entry = (time.monotonic() + seconds, method(self, *args, **kwargs))
+                    self._cache[key] = entry
+                value = entry[1]
+            return value.copy() if isinstance(value, dict) else value
+        return wrapper
+    return decorator
 
 class ImprovedProxyDaemonManager:
-    def __init__(self):
+    # Per-probe timeout, and the wall-clock budget for the whole health check
+    HEALTH_PROBE_TIMEOUT = 5
+    HEALTH_CHECK_DEADLINE = 8
+    # Proxies sampled per health check
+    HEALTH_PROBE_COUNT = 3
+    
+    # How long status/health results are reused before checking again
+    CACHE_TTL = 15
+    
+    def __init__(self, use_cache=True):
         self.status_file = "daemon_status.json"
         self.pid_file = "daemon.pid"
         self.lock_file = "daemon.lock"
         self.health_check_url = "http://httpbin.org/ip"
+        self.use_cache = use_cache
+        self._cache = {}
+        self._cache_lock = threading.RLock()
+        # pid -> joined command line; a live pid keeps its cmdline, so it is
+        # read from /proc once per pid rather than on every check
+        self._cmdline_cache = {}
+        # psutil handle for the daemon, kept so cpu_percent() can measure
+        # against the previous call instead of always reporting 0
+        self._proc = None
+        self._proc_pid = None
+        # Probe threads are started on the first health check and reused by
+        # later ones instead of spinning up a new pool every time
+        self._probe_executor = None
+        
+    def clear_cache(self):
+        """Drop cached results so the next call checks again"""
+        with self._cache_lock:
+            self._cache.clear()
         
     def get_enhanced_status(self):
         """Get detailed daemon status with health checks"""
         base_status = self.get_basic_status()
         
-        # Add process health check
-        is_running = self.is_daemon_running()
+        # Add process health check; the pid found here is handed on so the
+        # resource snapshot doesn't read the PID file again
+        pid = self._daemon_pid()
+        is_running = pid is not None
         base_status["process_running"] = is_running
         
         # Add proxy health check
@@ -36,11 +176,12 @@ class ImprovedProxyDaemonManager:
             
         # Add system resources
         if is_running:
-            resource_usage = self.get_resource_usage()
+            resource_usage = self.get_resource_usage(pid)
             base_status["resources"] = resource_usage
             
         return base_status
     
+    @ttl_cached(CACHE_TTL)
     def get_basic_status(self):
         """Get basic status from file"""
         if not os.path.exists(self.status_file):
@@ -51,8 +192,8 @@ class ImprovedProxyDaemonManager:
             }
             
         try:
-            with open(self.status_file, 'r') as f:
-                status = json.load(f)
+            with open(self.status_file, 'rb') as f:
+                status = _loads_status(f.read())
             
             # Validate status structure
             required_fields = ["status", "started"]
@@ -74,70 +215,156 @@ class ImprovedProxyDaemonManager:
                 "timestamp": datetime.now().isoformat()
             }
     
+    def _read_pid_bytes(self):
+        """Read the raw PID file contents, stripped
+        
+        A pid is a few ASCII digits, so a bare os.read avoids building a
+        text file object and decoding. Raises FileNotFoundError if missing.
+        """
+        fd = os.open(self.pid_file, os.O_RDONLY)
+        try:
+            return os.read(fd, 16).strip()
+        finally:
+            os.close(fd)
+    
     def is_daemon_running(self):
         """Enhanced daemon process check with validation"""
-        if not os.path.exists(self.pid_file):
-            return False
-            
+        return self._daemon_pid() is not None
+    
+    def _daemon_pid(self):
+        """Return the daemon's pid if it is running, else None"""
+        try:
+            content = self._read_pid_bytes()
+        except OSError:
+            return None
+        if not content.isdigit():
+            return None
+        
+        import psutil
+        
         try:
-            with open(self.pid_file, 'r') as f:
-                content = f.read().strip()
-                if not content.isdigit():
-                    return False
-                pid = int(content)
+            pid = int(content)
                 
             # Check if process exists and is our daemon
-            if not psutil.pid_exists(pid):
-                return False
+            if not _pid_alive(pid):
+                self._cmdline_cache.pop(pid, None)
+                return None
                 
-            process = psutil.Process(pid)
+            cmdline = self._cmdline_cache.get(pid)
+            if cmdline is None:
+                cmdline = " ".join(psutil.Process(pid).cmdline())
+                self._cmdline_cache[pid] = cmdline
             
             # Verify it's actually our Python daemon process
-            cmdline = process.cmdline()
-            if any("proxy_chain_daemon.py" in arg for arg in cmdline):
-                return True
+            if "proxy_chain_daemon.py" in cmdline:
+                return pid
             else:
                 # PID file contains wrong process, clean it up
                 os.remove(self.pid_file)
-                return False
+                return None
                 
         except (ValueError, psutil.NoSuchProcess, PermissionError):
             # Clean up invalid PID file
             if os.path.exists(self.pid_file):
                 os.remove(self.pid_file)
+            return None
+    
+    def _probe_proxy(self, proxy):
+        """Return True if a request through the proxy succeeds"""
+        try:
+            proxy_dict = {
+                'http': f'http://{proxy}',
+                'https': f'http://{proxy}'
+            }
+            response = _get_session().get(
+                self.health_check_url, 
+                proxies=proxy_dict, 
+                timeout=self.HEALTH_PROBE_TIMEOUT
+            )
+            return response.status_code == 200
+        except Exception:
             return False
     
-    def check_proxy_health(self):
+    def _read_proxy_head(self):
+        """Return (first HEALTH_PROBE_COUNT proxies, total proxy count)
+        
+        The file is memory-mapped: the sampled lines are sliced out with
+        mmap.find and the rest are counted by a regex scan over the mapping,
+        so no string is built for the proxies that are only counted. Raises
+        FileNotFoundError if there is no proxy file.
+        """
+        with open('working_proxies.txt', 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap refuses empty files
+                return [], 0
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                head = []
+                pos = 0
+                while len(head) < self.HEALTH_PROBE_COUNT and pos < len(mm):
+                    nl = mm.find(b'\n', pos)
+                    end = len(mm) if nl < 0 else nl
+                    line = mm[pos:end].strip()
+                    if line:
+                        head.append(line.decode())
+                    pos = end + 1
+                total = len(head) + sum(1 for _ in _NON_BLANK_LINE.finditer(mm, pos))
+        return head, total
+    
+    def _collect_facts(self, check_process=True, read_proxies=True):
+        """Gather the file and process state the integrity and health checks share
+        
+        One directory scan, at most one pid lookup and one pass over the
+        proxy file; callers running both checks pass the result to each.
+        """
+        entries = {entry.name: entry for entry in os.scandir('.')}
+        proxies_entry = entries.get('working_proxies.txt')
+        facts = {
+            "pid_file_exists": self.pid_file in entries,
+            "status_file_exists": self.status_file in entries,
+            "logs_exists": 'logs' in entries,
+            # DirEntry caches its stat, so the size costs nothing extra
+            "proxies_size": proxies_entry.stat().st_size if proxies_entry else None,
+        }
+        if check_process:
+            facts["pid"] = self._daemon_pid() if facts["pid_file_exists"] else None
+        if read_proxies:
+            facts["proxies_head"], facts["proxies_total"] = (
+                self._read_proxy_head() if proxies_entry else ([], 0))
+        return facts
+    
+    @ttl_cached(CACHE_TTL)
+    def check_proxy_health(self, facts=None):
         """Check if proxies are actually working"""
         try:
-            if not os.path.exists('working_proxies.txt'):
-                return {"working": 0, "total": 0, "health": "no_proxies"}
-            
-            with open('working_proxies.txt', 'r') as f:
-                proxies = [line.strip() for line in f if line.strip()]
+            # Opening directly covers the existence check as well
+            if facts is None:
+                try:
+                    test_proxies, total = self._read_proxy_head()
+                except FileNotFoundError:
+                    return {"working": 0, "total": 0, "health": "no_proxies"}
+            else:
+                test_proxies, total = facts["proxies_head"], facts["proxies_total"]
             
-            if not proxies:
+            if not test_proxies:
                 return {"working": 0, "total": 0, "health": "no_proxies"}
             
-            # Test up to 3 proxies for health check
-            test_proxies = proxies[:3]
+            # Test the sampled proxies all at once so a dead proxy costs one
+            # timeout rather than adding to the others
             working_count = 0
             
-            for proxy in test_proxies:
-                try:
-                    proxy_dict = {
-                        'http': f'http://{proxy}',
-                        'https': f'http://{proxy}'
-                    }
-                    response = requests.get(
-                        self.health_check_url, 
-                        proxies=proxy_dict, 
-                        timeout=10
-                    )
-                    if response.status_code == 200:
+            # Build the shared session here, before the probe threads need it
+            _get_session()
+            if self._probe_executor is None:
+                self._probe_executor = ThreadPoolExecutor(max_workers=self.HEALTH_PROBE_COUNT)
+            futures = [self._probe_executor.submit(self._probe_proxy, proxy) for proxy in test_proxies]
+            try:
+                for future in as_completed(futures, timeout=self.HEALTH_CHECK_DEADLINE):
+                    if future.result():
                         working_count += 1
-                except:
-                    pass
+            except FuturesTimeout:
+                # Probes still running past the deadline count as not working
+                for future in futures:
+                    future.cancel()
             
             health_ratio = working_count / len(test_proxies)
             if health_ratio >= 0.7:
@@ -150,7 +377,7 @@ class ImprovedProxyDaemonManager:
             return {
                 "working": working_count,
                 "tested": len(test_proxies),
-                "total": len(proxies),
+                "total": total,
                 "health": health,
                 "ratio": round(health_ratio * 100, 1)
             }
@@ -158,40 +385,65 @@ class ImprovedProxyDaemonManager:
         except Exception as e:
             return {"working": 0, "total": 0, "health": "error", "error": str(e)}
     
-    def get_resource_usage(self):
-        """Get daemon process resource usage"""
+    @ttl_cached(CACHE_TTL)
+    def get_resource_usage(self, pid=None):
+        """Get daemon process resource usage
+        
+        Pass the pid when the caller has just confirmed the daemon is
+        running, to skip re-reading the PID file and re-checking liveness.
+        """
         try:
-            if not os.path.exists(self.pid_file):
-                return {"error": "PID file not found"}
-            
-            with open(self.pid_file, 'r') as f:
-                pid = int(f.read().strip())
+            if pid is None:
+                try:
+                    pid = int(self._read_pid_bytes())
+                except FileNotFoundError:
+                    return {"error": "PID file not found"}
+                
+                if not _pid_alive(pid):
+                    return {"error": f"Process {pid} not running"}
             
-            process = psutil.Process(pid)
+            if self._proc is None or self._proc_pid != pid:
+                import psutil
+                self._proc = psutil.Process(pid)
+                self._proc_pid = pid
+                self._proc.cpu_percent(interval=None)
+            process = self._proc
             
-            return {
-                "cpu_percent": round(process.cpu_percent(), 2),
-                "memory_mb": round(process.memory_info().rss / 1024 / 1024, 2),
-                "threads": process.num_threads(),
-                "status": process.status(),
-                "uptime_seconds": int(time.time() - process.create_time())
-            }
+            # oneshot() reads /proc/<pid>/stat and friends once for all getters
+            with process.oneshot():
+                return {
+                    "cpu_percent": round(process.cpu_percent(), 2),
+                    "memory_mb": round(process.memory_info().rss / 1024 / 1024, 2),
+                    "threads": process.num_threads(),
+                    "status": process.status(),
+                    "uptime_seconds": int(time.time() - process.create_time())
+                }
             
         except Exception as e:
             return {"error": str(e)}
     
-    def validate_daemon_integrity(self):
-        """Comprehensive daemon integrity check"""
+    @ttl_cached(CACHE_TTL)
+    def validate_daemon_integrity(self, is_running=None, facts=None):
+        """Comprehensive daemon integrity check
+        
+        Pass is_running when the caller already checked the process, or
+        facts from _collect_facts(), so nothing is probed a second time.
+        """
         issues = []
         
+        if facts is None:
+            facts = self._collect_facts(check_process=is_running is None, read_proxies=False)
+        if is_running is None:
+            is_running = facts["pid"] is not None
+        
         # Check PID file
-        if not os.path.exists(self.pid_file):
+        if not facts["pid_file_exists"]:
             issues.append("PID file missing")
-        elif not self.is_daemon_running():
+        elif not is_running:
             issues.append("Process not running (stale PID)")
         
         # Check status file
-        if not os.path.exists(self.status_file):
+        if not facts["status_file_exists"]:
             issues.append("Status file missing")
         else:
             status = self.get_basic_status()
@@ -199,13 +451,13 @@ class ImprovedProxyDaemonManager:
                 issues.append("Status file corrupted")
         
         # Check proxy files
-        if not os.path.exists('working_proxies.txt'):
+        if facts["proxies_size"] is None:
             issues.append("Proxy file missing")
-        elif os.path.getsize('working_proxies.txt') == 0:
+        elif facts["proxies_size"] == 0:
             issues.append("No proxies available")
         
         # Check logs directory
-        if not os.path.exists('logs'):
+        if not facts["logs_exists"]:
             issues.append("Logs directory missing")
         
         return {
@@ -217,6 +469,8 @@ class ImprovedProxyDaemonManager:
     def repair_daemon_files(self):
         """Attempt to repair common daemon issues"""
         repairs = []
+        # Repairs must act on what is on disk now, not a cached view
+        self.clear_cache()
         
         # Remove stale PID file
         if os.path.exists(self.pid_file) and not self.is_daemon_running():
@@ -239,8 +493,9 @@ class ImprovedProxyDaemonManager:
                 "total_refreshes": 0,
                 "timestamp": datetime.now().isoformat()
             }
-            with open(self.status_file, 'w') as f:
-                json.dump(default_status, f, indent=2)
+            with open(self.status_file, 'wb') as f:
+                f.write(_dumps_status(default_status))
+            self.clear_cache()
             repairs.append("Reset corrupted status file")
         
         return repairs
@@ -259,21 +514,26 @@ class ImprovedProxyDaemonManager:
         print("🚀 Starting proxy chain daemon...")
         
         try:
-            # Start daemon process with better error handling
-            process = subprocess.Popen([
-                sys.executable, "proxy_chain_daemon.py",
-                "--refresh-interval", str(refresh_interval),
-                "--daemon"
-            ], 
-            creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-            )
+            # stderr goes to a log instead of an undrained pipe, so a chatty
+            # daemon can't block on a full buffer and crashes can be read later
+            stderr_log = os.path.join('logs', 'daemon.stderr')
+            with open(stderr_log, 'ab') as stderr_file:
+                log_offset = stderr_file.tell()
+                process = subprocess.Popen([
+                    sys.executable, "proxy_chain_daemon.py",
+                    "--refresh-interval", str(refresh_interval),
+                    "--daemon"
+                ], 
+                creationflags=subprocess.CREATE_NEW_CONSOLE if os.name == 'nt' else 0,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr_file
+                )
             
-            # Wait briefly to check if it started successfully
-            time.sleep(2)
-            
-            if process.poll() is None:  # Process is still running
+            # Block in a real wait for up to 2 seconds: returning means the
+            # daemon exited, timing out means it is still up
+            try:
+                process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
                 # Save PID
                 self.save_pid(process.pid)
                 print(f"✅ Daemon started successfully with PID {process.pid}")
@@ -286,12 +546,14 @@ class ImprovedProxyDaemonManager:
                 })
                 
                 return {"success": True, "pid": process.pid}
-            else:
-                # Process died immediately
-                stdout, stderr = process.communicate()
-                error_msg = stderr.decode() if stderr else "Unknown error"
-                print(f"❌ Daemon failed to start: {error_msg}")
-                return {"success": False, "message": error_msg}
+            
+            # Process died immediately
+            with open(stderr_log, 'rb') as f:
+                f.seek(log_offset)
+                stderr = f.read()
+            error_msg = stderr.decode(errors='replace') if stderr else "Unknown error"
+            print(f"❌ Daemon failed to start: {error_msg}")
+            return {"success": False, "message": error_msg}
                 
         except Exception as e:
             print(f"❌ Error starting daemon: {e}")
@@ -309,93 +571,157 @@ class ImprovedProxyDaemonManager:
                 os.remove(temp_file)
             raise
     
+    @contextmanager
+    def _locked(self):
+        """Hold an exclusive lock on the lock file, blocking until it is free"""
+        with open(self.lock_file, 'a+b') as lock:
+            if fcntl is not None:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+            else:
+                lock.seek(0)
+                msvcrt.locking(lock.fileno(), msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_UN)
+                else:
+                    lock.seek(0)
+                    msvcrt.locking(lock.fileno(), msvcrt.LK_UNLCK, 1)
+    
     def update_status(self, updates):
         """Update status file with new information"""
-        current_status = self.get_basic_status()
-        current_status.update(updates)
-        current_status["last_updated"] = datetime.now().isoformat()
+        # Serialize the read-modify-write with other managers so concurrent
+        # updates can't overwrite each other
+        with self._locked():
+            # Read-modify-write must start from the file, not a cached copy
+            self.clear_cache()
+            current_status = self.get_basic_status()
+            current_status.update(updates)
+            current_status["last_updated"] = datetime.now().isoformat()
+            
+            try:
+                self._write_status_bytes(_dumps_status(current_status))
+            finally:
+                self.clear_cache()
+    
+    def _write_status_bytes(self, data):
+        """Atomically replace the status file with data
         
+        On Linux the bytes go to an unnamed O_TMPFILE that only gets a name
+        once fully written and fsynced, so a crash mid-write leaves no stale
+        .tmp behind. The final swap is still os.replace, since linkat can't
+        overwrite an existing file. Elsewhere, or on filesystems without
+        O_TMPFILE support, a named temp file is used.
+        """
         temp_file = f"{self.status_file}.tmp"
+        fd = None
+        if hasattr(os, 'O_TMPFILE'):
+            try:
+                status_dir = os.path.dirname(os.path.abspath(self.status_file))
+                fd = os.open(status_dir, os.O_TMPFILE | os.O_WRONLY, 0o644)
+            except OSError:
+                fd = None
+        
+        if fd is not None:
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                    # Left over from an interrupted fallback write
+                    if os.path.exists(temp_file):
+                        os.remove(temp_file)
+                    os.link(f'/proc/self/fd/{f.fileno()}', temp_file, follow_symlinks=True)
+                os.replace(temp_file, self.status_file)
+                return
+            except OSError:
+                # e.g. /proc not mounted; fall back to the named temp file
+                if os.path.exists(temp_file):
+                    os.remove(temp_file)
+        
         try:
-            with open(temp_file, 'w') as f:
-                json.dump(current_status, f, indent=2)
+            with open(temp_file, 'wb') as f:
+                f.write(data)
             os.replace(temp_file, self.status_file)
         except Exception:
             if os.path.exists(temp_file):
                 os.remove(temp_file)
             raise
     
-    def show_enhanced_status(self):
-        """Display comprehensive status with health checks"""
-        print("🔗 ENHANCED Proxy Chain Daemon Status")
-        print("=" * 50)
+    def show_enhanced_status(self, out=None):
+        """Display comprehensive status with health checks, written to `out`
+        (sys.stdout by default)"""
+        print("🔗 ENHANCED Proxy Chain Daemon Status", file=out)
+        print("=" * 50, file=out)
         
         # Get comprehensive status
         status = self.get_enhanced_status()
-        integrity = self.validate_daemon_integrity()
+        integrity = self.validate_daemon_integrity(status["process_running"])
         
         # Process Status
         if status.get("process_running"):
-            print("🟢 Process: RUNNING")
+            print("🟢 Process: RUNNING", file=out)
         else:
-            print("🔴 Process: STOPPED")
+            print("🔴 Process: STOPPED", file=out)
         
         # Basic Info
         if status.get('started'):
-            started_time = datetime.fromisoformat(status['started'])
+            started_time = _parse_iso(status['started'])
             uptime = datetime.now() - started_time
-            print(f"📅 Started: {started_time.strftime('%Y-%m-%d %H:%M:%S')}")
-            print(f"⏱️  Uptime: {str(uptime).split('.')[0]}")
+            print(f"📅 Started: {started_time.strftime('%Y-%m-%d %H:%M:%S')}", file=out)
+            print(f"⏱️  Uptime: {str(uptime).split('.')[0]}", file=out)
         
         # Resource Usage
         if "resources" in status:
             res = status["resources"]
             if "error" not in res:
-                print(f"💾 Memory: {res['memory_mb']} MB")
-                print(f"🖥️  CPU: {res['cpu_percent']}%")
-                print(f"🧵 Threads: {res['threads']}")
+                print(f"💾 Memory: {res['memory_mb']} MB", file=out)
+                print(f"🖥️  CPU: {res['cpu_percent']}%", file=out)
+                print(f"🧵 Threads: {res['threads']}", file=out)
         
         # Proxy Health
         if "proxy_health" in status:
             health = status["proxy_health"]
             if "error" not in health:
-                print(f"🎯 Proxy Health: {health['health'].upper()}")
-                print(f"✅ Working: {health['working']}/{health['total']} ({health.get('ratio', 0)}%)")
+                print(f"🎯 Proxy Health: {health['health'].upper()}", file=out)
+                print(f"✅ Working: {health['working']}/{health['total']} ({health.get('ratio', 0)}%)", file=out)
         
         # System Integrity
-        print(f"\n🔍 System Integrity: {'✅ HEALTHY' if integrity['healthy'] else '⚠️ ISSUES DETECTED'}")
+        print(f"\n🔍 System Integrity: {'✅ HEALTHY' if integrity['healthy'] else '⚠️ ISSUES DETECTED'}", file=out)
         if not integrity['healthy']:
             for issue in integrity['issues']:
-                print(f"   ❌ {issue}")
+                print(f"   ❌ {issue}", file=out)
         
         # Configuration
-        print(f"\n📊 Status: {status.get('status', 'unknown')}")
-        print(f"🔢 Refreshes: {status.get('total_refreshes', 0)}")
+        print(f"\n📊 Status: {status.get('status', 'unknown')}", file=out)
+        print(f"🔢 Refreshes: {status.get('total_refreshes', 0)}", file=out)
         
         if status.get('last_refresh'):
-            print(f"🔄 Last Refresh: {status['last_refresh']}")
+            print(f"🔄 Last Refresh: {status['last_refresh']}", file=out)
         
         return status
 
-def main():
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Enhanced Proxy Daemon Manager")
+def main(argv=None, out=None, err=None):
+    parser = _StreamArgumentParser(prog="improved_proxy_status.py", description="Enhanced Proxy Daemon Manager",
+                                   out=out, err=err)
     parser.add_argument('action', choices=['start', 'stop', 'restart', 'status', 'health', 'repair'], 
                        help='Action to perform')
     parser.add_argument('--refresh-interval', type=int, default=3600,
                        help='Proxy refresh interval in seconds (default: 3600)')
     parser.add_argument('--json', action='store_true', 
                        help='Output status in JSON format')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Always run fresh status/health checks')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
-    manager = ImprovedProxyDaemonManager()
+    manager = ImprovedProxyDaemonManager(use_cache=not args.no_cache)
     
     if args.action == 'start':
         result = manager.start_daemon_enhanced(args.refresh_interval)
         if args.json:
-            print(json.dumps(result))
+            print(json.dumps(result), file=out)
     elif args.action == 'stop':
         # Use the original stop method (it's fine)
         from proxy_status import ProxyDaemonManager
@@ -408,18 +734,25 @@ def main():
     elif args.action == 'status':
         if args.json:
             status = manager.get_enhanced_status()
-            print(json.dumps(status, indent=2))
+            print(json.dumps(status, indent=2), file=out)
         else:
-            manager.show_enhanced_status()
+            manager.show_enhanced_status(out)
     elif args.action == 'health':
-        integrity = manager.validate_daemon_integrity()
-        proxy_health = manager.check_proxy_health()
-        print(json.dumps({"integrity": integrity, "proxy_health": proxy_health}, indent=2))
+        # Gather file and process state once for both checks
+        facts = manager._collect_facts()
+        integrity = manager.validate_daemon_integrity(facts=facts)
+        # Nothing is serving through the proxies while the daemon is down,
+        # so skip the network probes instead of waiting out their timeouts
+        if facts["pid"] is not None:
+            proxy_health = manager.check_proxy_health(facts)
+        else:
+            proxy_health = {"health": "daemon_stopped"}
+        print(json.dumps({"integrity": integrity, "proxy_health": proxy_health}, indent=2), file=out)
     elif args.action == 'repair':
         repairs = manager.repair_daemon_files()
-        print(f"🔧 Applied {len(repairs)} repairs:")
+        print(f"🔧 Applied {len(repairs)} repairs:", file=out)
         for repair in repairs:
-            print(f"   ✅ {repair}")
+            print(f"   ✅ {repair}", file=out)
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,7 @@ One-command setup and start for proxy chain daemon
 
 import os
 import sys
+import asyncio
 import subprocess
 import time
 import json
@@ -48,24 +49,45 @@ class ProxyChainInitializer:
             print("Run: pip install -r requirements.txt")
             return False
     
-    def install_requirements(self):
-        """Install required Python packages"""
+    async def install_requirements_async(self):
+        """Install required Python packages, streaming pip's output as it runs"""
         print("📦 Installing Python requirements...")
+        # requirements.txt already lists psutil, which the daemon needs
         try:
-            subprocess.run([
-                sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt'
-            ], check=True, cwd=self.base_dir)
-            
-            # Install additional packages for daemon
-            subprocess.run([
-                sys.executable, '-m', 'pip', 'install', 'psutil'
-            ], check=True, cwd=self.base_dir)
-            
-            print("✅ Requirements installed successfully")
-            return True
-        except subprocess.CalledProcessError as e:
+            process = await asyncio.create_subprocess_exec(
+                sys.executable, '-m', 'pip', 'install', '-r', 'requirements.txt',
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                cwd=self.base_dir
+            )
+            async for line in process.stdout:
+                print(f"   {line.decode(errors='replace').rstrip()}")
+            returncode = await process.wait()
+        except OSError as e:
             print(f"❌ Failed to install requirements: {e}")
             return False
+        
+        if returncode != 0:
+            print(f"❌ Failed to install requirements: pip exited with status {returncode}")
+            return False
+        print("✅ Requirements installed successfully")
+        return True
+    
+    def install_requirements(self):
+        """Install required Python packages"""
+        return asyncio.run(self.install_requirements_async())
+    
+    async def _install_and_setup(self):
+        """Run the pip install and the directory setup concurrently"""
+        installed, _ = await asyncio.gather(
+            self.install_requirements_async(),
+            asyncio.to_thread(self.setup_directories)
+        )
+        return installed
+    
+    def install_and_setup(self):
+        """Install requirements and create directories at the same time"""
+        return asyncio.run(self._install_and_setup())
     
     def setup_directories(self):
         """Create necessary directories"""
@@ -153,12 +175,13 @@ def main():
     # Step 1: Check dependencies
     if not initializer.check_dependencies():
         print("📦 Installing missing dependencies...")
-        if not initializer.install_requirements():
+        # Step 2: Setup directories, alongside the install
+        if not initializer.install_and_setup():
             print("❌ Failed to install dependencies. Please install manually.")
             return
-    
-    # Step 2: Setup directories
-    initializer.setup_directories()
+    else:
+        # Step 2: Setup directories
+        initializer.setup_directories()
     
     # Step 3: Start daemon
     if not initializer.start_daemon():
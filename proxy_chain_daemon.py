@@ -5,7 +5,7 @@ Continuously maintains and updates proxy chains in the background
 """
 
 import json
-import time
+import asyncio
 import logging
 import threading
 import os
@@ -20,6 +20,9 @@ class ProxyChainDaemon:
     def __init__(self, refresh_interval=3600):  # 1 hour default
         self.refresh_interval = refresh_interval
         self.running = True
+        # Event loop and stop event of the running daemon, set up in run()
+        self._loop = None
+        self._stop_event = None
         self.manager = ProxyChainManager()
         self.status = {
             'started': datetime.now().isoformat(),
@@ -59,6 +62,9 @@ class ProxyChainDaemon:
         """Handle shutdown signals gracefully"""
         self.logger.info(f"Received signal {signum}, shutting down gracefully...")
         self.running = False
+        if self._loop is not None:
+            # Wake the main loop's sleep right away
+            self._loop.call_soon_threadsafe(self._stop_event.set)
         
     def cleanup(self):
         """Cleanup on exit"""
@@ -100,7 +106,7 @@ class ProxyChainDaemon:
                 
                 # Update configurations
                 from proxy_chain_setup import export_configs
-                export_configs(working_proxies)
+                export_configs(working_proxies, self.manager.working_socks_proxies)
                 
                 self.status.update({
                     'last_refresh': datetime.now().isoformat(),
@@ -150,13 +156,29 @@ class ProxyChainDaemon:
             
         return False
         
-    def run(self):
+    async def _sleep(self, seconds):
+        """Sleep that returns early once the daemon is asked to stop"""
+        try:
+            await asyncio.wait_for(self._stop_event.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def run(self):
         """Main daemon loop"""
         self.logger.info("Proxy Chain Daemon starting...")
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(signum, self.signal_handler, signum, None)
+            except (NotImplementedError, RuntimeError):
+                # Windows has no loop signal handlers; the signal.signal
+                # handlers from __init__ stay in place and wake the loop
+                pass
         
         # Load existing proxies or perform initial refresh
         if not self.load_existing_proxies():
-            self.refresh_proxies()
+            await asyncio.to_thread(self.refresh_proxies)
         else:
             self.status.update({
                 'working_proxies': len(self.manager.working_proxies),
@@ -168,6 +190,9 @@ class ProxyChainDaemon:
         last_refresh = datetime.now()
         health_check_interval = 300  # 5 minutes
         last_health_check = datetime.now()
+        # Refreshes take minutes, so they run in a background task and health
+        # checks carry on meanwhile
+        refresh_task = None
         
         while self.running:
             try:
@@ -176,24 +201,25 @@ class ProxyChainDaemon:
                 # Perform periodic health checks
                 if (current_time - last_health_check).seconds >= health_check_interval:
                     if self.manager.working_proxies:
-                        self.health_check()
+                        await asyncio.to_thread(self.health_check)
                     last_health_check = current_time
                 
                 # Refresh proxies periodically
                 if (current_time - last_refresh).seconds >= self.refresh_interval:
-                    self.refresh_proxies()
+                    if refresh_task is None or refresh_task.done():
+                        refresh_task = asyncio.create_task(asyncio.to_thread(self.refresh_proxies))
                     last_refresh = current_time
                 
                 # Sleep for a short interval
-                time.sleep(30)  # Check every 30 seconds
+                await self._sleep(30)  # Check every 30 seconds
                 
-            except KeyboardInterrupt:
-                self.logger.info("Received keyboard interrupt, shutting down...")
-                break
             except Exception as e:
                 self.logger.error(f"Unexpected error in daemon loop: {e}")
-                time.sleep(60)  # Wait a minute before continuing
-                
+                await self._sleep(60)  # Wait a minute before continuing
+        
+        if refresh_task is not None and not refresh_task.done():
+            self.logger.info("Waiting for the running proxy refresh to finish...")
+            await refresh_task
         self.cleanup()
 
 def main():
@@ -222,7 +248,10 @@ def main():
         return
     
     daemon = ProxyChainDaemon(refresh_interval=args.refresh_interval)
-    daemon.run()
+    try:
+        asyncio.run(daemon.run())
+    except KeyboardInterrupt:
+        daemon.logger.info("Received keyboard interrupt, shutting down...")
 
 if __name__ == "__main__":
     main()
@@ -5,130 +5,242 @@ Fetches free proxies from multiple sources and sets up rotation
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import asyncio
 import json
 import random
+import heapq
 import time
 import socket
 import threading
 from urllib.parse import urlparse
 import sys
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import re
+from collections import namedtuple
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# One "ip:port" entry per line of a text proxy list; comment lines and other
+# formats simply don't match
+_PROXY_RE = re.compile(rb'^[ \t]*(\d{1,3}(?:\.\d{1,3}){3}):(\d{1,5})[ \t\r]*$', re.MULTILINE)
+
+class ProxyRec(namedtuple('ProxyRec', 'proxy ip port protocol')):
+    """A proxy parsed once when it is fetched: the "ip:port" string, its
+    host and integer port, and the protocol its source lists it under"""
+    __slots__ = ()
+    
+    @classmethod
+    def parse(cls, proxy, protocol='http'):
+        """Build a record from "ip:port", or return None if it is malformed"""
+        ip, sep, port = proxy.rpartition(':')
+        if not sep or not ip or not port.isdigit() or not 0 < int(port) < 65536:
+            return None
+        return cls(proxy, ip, int(port), protocol)
+
 class ProxyChainManager:
-    def __init__(self):
-        self.working_proxies = []
+    # Endpoint proxies are tested against: an empty 204 from an anycast host,
+    # so probes are quick, tiny, and not rate limited like httpbin.org
+    DEFAULT_JUDGE_URL = 'http://www.gstatic.com/generate_204'
+    # Status codes that count as a working proxy
+    JUDGE_OK_STATUS = (200, 204)
+    # Seconds allowed for the TCP connect; most listed proxies are dead and
+    # fail here, long before the full request timeout
+    CONNECT_TIMEOUT = 2
+    # Seconds to wait for a probe's socket to finish closing
+    CLOSE_TIMEOUT = 1
+    # Protocols probed through a SOCKS tunnel; everything else (http, https)
+    # is an HTTP proxy
+    SOCKS_PROTOCOLS = ('socks4', 'socks5')
+    # Reliability score of a working proxy that has not been scored yet
+    DEFAULT_SCORE = 0.5
+    
+    def __init__(self, judge_url=DEFAULT_JUDGE_URL):
+        self.judge_url = judge_url
+        # Request sent through each candidate during validation; HTTP proxies
+        # take the absolute URL in the request line
+        judge = urlparse(judge_url)
+        self.probe_request = (f"GET {judge_url} HTTP/1.1\r\n"
+                              f"Host: {judge.netloc}\r\n"
+                              f"Connection: close\r\n\r\n").encode()
+        # SOCKS proxies are asked for a tunnel to the judge, which then gets
+        # an ordinary origin-form request
+        self.judge_host = judge.hostname
+        self.judge_port = judge.port or 80
+        self.tunnel_request = (f"GET {judge.path or '/'} HTTP/1.1\r\n"
+                               f"Host: {judge.netloc}\r\n"
+                               f"Connection: close\r\n\r\n").encode()
+        # proxy -> reliability score, in discovery order; see the property below
+        self.working_proxies = {}
+        # Working SOCKS proxies as ProxyRecs; working_proxies stays
+        # HTTP-only because the scanner and config users speak HTTP to it
+        self.working_socks_proxies = []
+        # Every proxy from the last fetch_all_proxies, as ProxyRecs
+        self.records = []
         self.dead_proxies = set()
-        self.proxy_scores = {}  # Track proxy reliability scores
+        # source name -> (protocol, url); protocol picks the validation probe
         self.proxy_sources = {
             # Existing sources
-            'free-proxy-list': 'https://www.proxy-list.download/api/v1/get?type=http',
-            'proxylist-geonode': 'https://proxylist.geonode.com/api/proxy-list?limit=500&page=1&sort_by=lastChecked&sort_type=desc',
-            'proxy-list-github': 'https://raw.githubusercontent.com/clarketm/proxy-list/master/proxy-list-raw.txt',
-            'free-proxy-csv': 'https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt',
+            'free-proxy-list': ('http', 'https://www.proxy-list.download/api/v1/get?type=http'),
+            'proxylist-geonode': ('http', 'https://proxylist.geonode.com/api/proxy-list?limit=500&page=1&sort_by=lastChecked&sort_type=desc'),
+            'proxy-list-github': ('http', 'https://raw.githubusercontent.com/clarketm/proxy-list/master/proxy-list-raw.txt'),
+            'free-proxy-csv': ('http', 'https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/http.txt'),
             
             # NEW: Additional reliable sources from your research
-            'monosans-http': 'https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/http.txt',
-            'monosans-socks4': 'https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/socks4.txt',
-            'monosans-socks5': 'https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/socks5.txt',
-            'proxifly-http': 'https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/http/data.txt',
-            'proxifly-https': 'https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/https/data.txt',
-            'proxifly-socks4': 'https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/socks4/data.txt',
-            'proxifly-socks5': 'https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/socks5/data.txt',
-            'vakhov-fresh-http': 'https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/http.txt',
-            'vakhov-fresh-https': 'https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/https.txt',
-            'vakhov-fresh-socks4': 'https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/socks4.txt',
-            'vakhov-fresh-socks5': 'https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/socks5.txt',
-            'speedx-socks4': 'https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/socks4.txt',
-            'speedx-socks5': 'https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/socks5.txt'
+            'monosans-http': ('http', 'https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/http.txt'),
+            'monosans-socks4': ('socks4', 'https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/socks4.txt'),
+            'monosans-socks5': ('socks5', 'https://raw.githubusercontent.com/monosans/proxy-list/main/proxies/socks5.txt'),
+            'proxifly-http': ('http', 'https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/http/data.txt'),
+            'proxifly-https': ('https', 'https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/https/data.txt'),
+            'proxifly-socks4': ('socks4', 'https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/socks4/data.txt'),
+            'proxifly-socks5': ('socks5', 'https://raw.githubusercontent.com/proxifly/free-proxy-list/main/proxies/protocols/socks5/data.txt'),
+            'vakhov-fresh-http': ('http', 'https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/http.txt'),
+            'vakhov-fresh-https': ('https', 'https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/https.txt'),
+            'vakhov-fresh-socks4': ('socks4', 'https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/socks4.txt'),
+            'vakhov-fresh-socks5': ('socks5', 'https://raw.githubusercontent.com/vakhov/fresh-proxy-list/master/socks5.txt'),
+            'speedx-socks4': ('socks4', 'https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/socks4.txt'),
+            'speedx-socks5': ('socks5', 'https://raw.githubusercontent.com/TheSpeedX/PROXY-List/master/socks5.txt')
         }
         
-    def fetch_proxies_from_api(self, source_name, url):
-        """Fetch proxies from API endpoints"""
+        # Shared session for source downloads, so connections (most sources are
+        # on raw.githubusercontent.com) stay open between fetches and refreshes;
+        # the pool fits every source being fetched at once
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.proxy_sources),
+                              pool_maxsize=len(self.proxy_sources), max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        
+    @property
+    def working_proxies(self):
+        """Working HTTP proxies as an insertion-ordered {proxy: score} dict,
+        so membership tests and removals are O(1)"""
+        return self._working_proxies
+    
+    @working_proxies.setter
+    def working_proxies(self, proxies):
+        # Plain lists (e.g. loaded from working_proxies.txt) start unscored
+        if not isinstance(proxies, dict):
+            proxies = dict.fromkeys(proxies, self.DEFAULT_SCORE)
+        self._working_proxies = proxies
+        self._proxy_pool = None
+    
+    @staticmethod
+    def _scan_proxy_lines(response, protocol):
+        """Stream a text proxy list and regex-scan it chunk by chunk, so only one
+        chunk plus an unfinished line is held in memory at a time"""
+        proxies = []
+        
+        def scan(buffer):
+            for ip, port in _PROXY_RE.findall(buffer):
+                ip, port = ip.decode(), int(port)
+                if 0 < port < 65536:
+                    proxies.append(ProxyRec(f"{ip}:{port}", ip, port, protocol))
+        
+        leftover = b''
+        for chunk in response.iter_content(chunk_size=65536):
+            buffer = leftover + chunk
+            # Scan up to the last complete line; the rest waits for the next chunk
+            cut = buffer.rfind(b'\n') + 1
+            scan(buffer[:cut])
+            leftover = buffer[cut:]
+        scan(leftover)
+        return proxies
+    
+    def fetch_proxies_from_api(self, source_name, url, protocol='http'):
+        """Fetch proxies from API endpoints as ProxyRecs"""
         try:
             logger.info(f"Fetching proxies from {source_name}")
-            response = requests.get(url, timeout=30)
-            
-            if source_name == 'proxylist-geonode':
-                data = response.json()
-                proxies = []
-                for proxy in data.get('data', []):
-                    if proxy.get('protocols', []):
-                        proxies.append(f"{proxy['ip']}:{proxy['port']}")
-                return proxies
-                
-            elif source_name.startswith(('proxy-list-github', 'free-proxy-csv', 'monosans-', 'proxifly-', 'vakhov-', 'speedx-')):
-                # Text-based proxy lists from GitHub sources
-                proxies = []
-                for line in response.text.strip().split('\n'):
-                    line = line.strip()
-                    # Skip comments, empty lines, and invalid formats
-                    if ':' in line and not line.startswith('#') and not line.startswith('//') and line:
-                        # Validate IP:PORT format
-                        parts = line.split(':')
-                        if len(parts) == 2:
-                            try:
-                                # Validate port is numeric
-                                int(parts[1])
-                                proxies.append(line)
-                            except ValueError:
-                                continue
-                return proxies
-                
-            else:
-                # Default handling for other APIs
-                return response.text.strip().split('\n')
+            with self.session.get(url, timeout=30, stream=True) as response:
+                if source_name == 'proxylist-geonode':
+                    data = response.json()
+                    proxies = []
+                    for proxy in data.get('data', []):
+                        if proxy.get('protocols', []):
+                            # geonode lists each entry's own protocols
+                            record = ProxyRec.parse(f"{proxy['ip']}:{proxy['port']}", proxy['protocols'][0])
+                            if record:
+                                proxies.append(record)
+                    return proxies
+                    
+                elif source_name.startswith(('proxy-list-github', 'free-proxy-csv', 'monosans-', 'proxifly-', 'vakhov-', 'speedx-')):
+                    # Text-based proxy lists from GitHub sources; these can run
+                    # to megabytes, so they are parsed while streaming
+                    return self._scan_proxy_lines(response, protocol)
+                    
+                else:
+                    # Default handling for other APIs
+                    records = (ProxyRec.parse(line.strip(), protocol)
+                               for line in response.text.strip().split('\n'))
+                    return [record for record in records if record]
                 
         except Exception as e:
             logger.error(f"Error fetching from {source_name}: {e}")
             return []
     
     def test_proxy(self, proxy, timeout=10):
-        """Test if a proxy is working"""
+        """Test if a proxy is working
+        
+        Takes a ProxyRec; a plain "ip:port" string is parsed into one first.
+        """
+        record = proxy if isinstance(proxy, ProxyRec) else ProxyRec.parse(proxy)
+        if record is None:
+            return False
+        
         try:
-            ip_port = proxy.split(':')
-            if len(ip_port) != 2:
-                return False
-                
-            ip, port = ip_port[0], int(ip_port[1])
-            
             # Test HTTP proxy
             proxy_dict = {
-                'http': f'http://{proxy}',
-                'https': f'http://{proxy}'
+                'http': f'http://{record.proxy}',
+                'https': f'http://{record.proxy}'
             }
             
             test_response = requests.get(
-                'http://httpbin.org/ip',
+                self.judge_url,
                 proxies=proxy_dict,
                 timeout=timeout
             )
             
-            if test_response.status_code == 200:
-                logger.info(f"✓ Proxy {proxy} is working")
+            if test_response.status_code in self.JUDGE_OK_STATUS:
+                logger.info(f"✓ Proxy {record.proxy} is working")
                 return True
                 
         except Exception as e:
-            logger.debug(f"✗ Proxy {proxy} failed: {e}")
+            logger.debug(f"✗ Proxy {record.proxy} failed: {e}")
             
         return False
     
+    @classmethod
+    def _probe_key(cls, record):
+        """Identity of the probe a record needs: http and https listings of
+        one ip:port get the same HTTP probe, SOCKS ones their own handshake"""
+        return record.proxy, (record.protocol if record.protocol in cls.SOCKS_PROTOCOLS else 'http')
+    
     def fetch_all_proxies(self):
         """Fetch proxies from all sources"""
-        all_proxies = set()
+        # Keyed by _probe_key, so an ip:port listed by several HTTP(S)
+        # sources is kept (and later probed) once
+        all_proxies = {}
         
-        for source_name, url in self.proxy_sources.items():
-            try:
-                proxies = self.fetch_proxies_from_api(source_name, url)
-                logger.info(f"Found {len(proxies)} proxies from {source_name}")
-                all_proxies.update(proxies)
-            except Exception as e:
-                logger.error(f"Failed to fetch from {source_name}: {e}")
+        # Downloads are independent, so fetch every source at once; the total
+        # wait is the slowest source rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=len(self.proxy_sources)) as executor:
+            futures = {
+                source_name: executor.submit(self.fetch_proxies_from_api, source_name, url, protocol)
+                for source_name, (protocol, url) in self.proxy_sources.items()
+            }
+            for source_name, future in futures.items():
+                try:
+                    proxies = future.result()
+                    logger.info(f"Found {len(proxies)} proxies from {source_name}")
+                    for record in proxies:
+                        all_proxies.setdefault(self._probe_key(record), record)
+                except Exception as e:
+                    logger.error(f"Failed to fetch from {source_name}: {e}")
         
         # Add some reliable public proxies as fallback
         fallback_proxies = [
@@ -137,39 +249,144 @@ class ProxyChainManager:
             "208.67.222.222:3128"
         ]
         
-        all_proxies.update(fallback_proxies)
+        for proxy in fallback_proxies:
+            record = ProxyRec.parse(proxy)
+            all_proxies.setdefault(self._probe_key(record), record)
         logger.info(f"Total unique proxies collected: {len(all_proxies)}")
-        return list(all_proxies)
+        self.records = list(all_proxies.values())
+        return self.records
     
-    def validate_proxies(self, proxy_list, max_workers=200):
-        """Validate proxies concurrently"""
+    async def _socks_connect(self, protocol, reader, writer):
+        """Ask a SOCKS4a/SOCKS5 proxy for a tunnel to the judge; True if granted"""
+        host = self.judge_host.encode('idna')
+        port = self.judge_port.to_bytes(2, 'big')
+        
+        if protocol == 'socks5':
+            # Greeting: version 5, one auth method offered, "no auth"
+            writer.write(b'\x05\x01\x00')
+            await writer.drain()
+            if await reader.readexactly(2) != b'\x05\x00':
+                return False
+            # CONNECT to the judge by hostname (address type 3)
+            writer.write(b'\x05\x01\x00\x03' + bytes([len(host)]) + host + port)
+            await writer.drain()
+            reply = await reader.readexactly(4)
+            if reply[1] != 0:
+                return False
+            # Skip the bound address (IPv4, hostname or IPv6) and its port
+            if reply[3] == 1:
+                await reader.readexactly(4 + 2)
+            elif reply[3] == 3:
+                length = (await reader.readexactly(1))[0]
+                await reader.readexactly(length + 2)
+            elif reply[3] == 4:
+                await reader.readexactly(16 + 2)
+            else:
+                return False
+            return True
+        
+        # SOCKS4a: destination 0.0.0.1 plus a hostname lets the proxy resolve it
+        writer.write(b'\x04\x01' + port + b'\x00\x00\x00\x01' + b'\x00' + host + b'\x00')
+        await writer.drain()
+        reply = await reader.readexactly(8)
+        return reply[1] == 0x5A
+    
+    async def _test_proxy_async(self, record, timeout=10):
+        """Async counterpart of test_proxy: send one HTTP request through the
+        proxy (or a SOCKS tunnel it opens) over a plain asyncio stream and
+        check the status line
+        
+        The TCP connect gets only CONNECT_TIMEOUT, so closed ports and dead
+        hosts are dropped after one round trip; the HTTP exchange reuses that
+        connection and gets the full timeout. Only the status line is read,
+        never the body.
+        """
+        proxy, protocol = record.proxy, record.protocol
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection(record.ip, record.port), min(self.CONNECT_TIMEOUT, timeout))
+        except Exception as e:
+            logger.debug(f"✗ Proxy {proxy} failed to connect: {e}")
+            return False
+        
+        try:
+            if protocol in self.SOCKS_PROTOCOLS:
+                if not await asyncio.wait_for(self._socks_connect(protocol, reader, writer), timeout):
+                    logger.debug(f"✗ Proxy {proxy} refused the {protocol} tunnel")
+                    return False
+                writer.write(self.tunnel_request)
+            else:
+                writer.write(self.probe_request)
+            await asyncio.wait_for(writer.drain(), timeout)
+            status_line = await asyncio.wait_for(reader.readline(), timeout)
+        except Exception as e:
+            logger.debug(f"✗ Proxy {proxy} failed: {e}")
+            return False
+        finally:
+            writer.close()
+            # Hold the semaphore slot until the socket is really gone, so
+            # closes don't pile up for asyncio.run to reap at loop teardown
+            with suppress(Exception):
+                await asyncio.wait_for(writer.wait_closed(), self.CLOSE_TIMEOUT)
+        
+        parts = status_line.split(None, 2)
+        if len(parts) >= 2 and parts[1].isdigit() and int(parts[1]) in self.JUDGE_OK_STATUS:
+            logger.info(f"✓ Proxy {proxy} ({protocol}) is working")
+            return True
+        return False
+    
+    async def validate_proxies_async(self, proxy_list, max_concurrent=500):
+        """Validate proxies concurrently on the running event loop
+        
+        Entries are ProxyRecs as returned by fetch_all_proxies, or plain
+        "ip:port" strings for HTTP proxies. Returns the working HTTP proxies;
+        working SOCKS ones are kept in working_socks_proxies.
+        """
         logger.info(f"Testing {len(proxy_list)} proxies...")
         working_proxies = []
+        working_socks_proxies = []
+        # Caps open sockets; the default stays under the common 1024 fd limit
+        semaphore = asyncio.Semaphore(max_concurrent)
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_proxy = {
-                executor.submit(self.test_proxy, proxy): proxy 
-                for proxy in proxy_list
-            }
-            
-            completed = 0
-            for future in as_completed(future_to_proxy):
-                proxy = future_to_proxy[future]
+        async def bounded(record):
+            async with semaphore:
+                return record, await self._test_proxy_async(record)
+        
+        # Records arrive parsed; plain strings are parsed once here. Malformed
+        # entries and repeats of an already queued probe count as tested
+        targets = {}
+        completed = 0
+        for entry in proxy_list:
+            record = entry if isinstance(entry, ProxyRec) else ProxyRec.parse(entry)
+            if record and self._probe_key(record) not in targets:
+                targets[self._probe_key(record)] = record
+            else:
                 completed += 1
-                
-                if completed % 10 == 0:
-                    logger.info(f"Tested {completed}/{len(proxy_list)} proxies...")
-                
-                try:
-                    if future.result():
-                        working_proxies.append(proxy)
-                except Exception as e:
-                    logger.debug(f"Error testing {proxy}: {e}")
+        
+        tasks = [asyncio.ensure_future(bounded(record)) for record in targets.values()]
+        for next_done in asyncio.as_completed(tasks):
+            record, working = await next_done
+            completed += 1
+            
+            if completed % 10 == 0:
+                logger.info(f"Tested {completed}/{len(proxy_list)} proxies...")
+            
+            if working:
+                if record.protocol in self.SOCKS_PROTOCOLS:
+                    working_socks_proxies.append(record)
+                else:
+                    working_proxies.append(record.proxy)
         
         self.working_proxies = working_proxies
-        logger.info(f"Found {len(working_proxies)} working proxies")
+        self.working_socks_proxies = working_socks_proxies
+        logger.info(f"Found {len(working_proxies)} working proxies "
+                    f"(plus {len(working_socks_proxies)} SOCKS)")
         return working_proxies
     
+    def validate_proxies(self, proxy_list, max_concurrent=500):
+        """Validate proxies concurrently"""
+        return asyncio.run(self.validate_proxies_async(proxy_list, max_concurrent))
+    
     def save_proxies(self, filename="working_proxies.txt"):
         """Save working proxies to file"""
         filepath = os.path.join(os.getcwd(), filename)
@@ -183,39 +400,38 @@ class ProxyChainManager:
         if not self.working_proxies:
             logger.warning("No working proxies available")
             return None
-        return random.choice(self.working_proxies)
+        # random.choice needs a sequence; the tuple is rebuilt only after the
+        # working set changes
+        if self._proxy_pool is None:
+            self._proxy_pool = tuple(self.working_proxies)
+        return random.choice(self._proxy_pool)
     
     def mark_proxy_dead(self, proxy):
         """Mark a proxy as dead and remove from working list"""
         if proxy in self.working_proxies:
-            self.working_proxies.remove(proxy)
+            del self.working_proxies[proxy]
+            self._proxy_pool = None
             self.dead_proxies.add(proxy)
             logger.info(f"Marked proxy {proxy} as dead")
     
     def remove_dead_proxies(self):
         """Remove dead proxies from working list"""
         initial_count = len(self.working_proxies)
-        self.working_proxies = [p for p in self.working_proxies if p not in self.dead_proxies]
+        self.working_proxies = {p: score for p, score in self.working_proxies.items()
+                                if p not in self.dead_proxies}
         removed_count = initial_count - len(self.working_proxies)
         if removed_count > 0:
             logger.info(f"Removed {removed_count} dead proxies")
         return removed_count
     
     def score_proxy_reliability(self, proxy, success_rate):
-        """Score proxy based on reliability"""
-        self.proxy_scores[proxy] = success_rate
+        """Score proxy based on reliability; only working proxies carry a score"""
+        if proxy in self.working_proxies:
+            self.working_proxies[proxy] = success_rate
     
     def get_best_proxies(self, count=10):
-        """Get the most reliable proxies"""
-        if not self.proxy_scores:
-            return self.working_proxies[:count]
-        
-        sorted_proxies = sorted(
-            self.proxy_scores.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )
-        return [proxy for proxy, score in sorted_proxies[:count] if proxy in self.working_proxies]
+        """Get the most reliable proxies; ties keep discovery order"""
+        return heapq.nlargest(count, self.working_proxies, key=self.working_proxies.get)
     
     def create_proxy_chain(self, chain_length=3):
         """Create a proxy chain configuration using best available proxies"""
@@ -226,9 +442,15 @@ class ProxyChainManager:
         # Use best proxies if we have reliability scores
         candidates = self.get_best_proxies(min(chain_length * 2, len(self.working_proxies)))
         if len(candidates) < chain_length:
-            candidates = self.working_proxies
+            candidates = list(self.working_proxies)
             
-        chain = random.sample(candidates, chain_length)
+        # Weighted sampling without replacement (Efraimidis-Spirakis): each
+        # candidate draws random() ** (1 / score) and the largest keys win, so
+        # more reliable proxies are likelier picks and none is picked twice
+        scores = self.working_proxies
+        chain = heapq.nlargest(
+            chain_length, candidates,
+            key=lambda proxy: random.random() ** (1 / max(scores.get(proxy, self.DEFAULT_SCORE), 1e-6)))
         logger.info(f"Created proxy chain: {' -> '.join(chain)}")
         return chain
 
@@ -266,7 +488,7 @@ def main():
         print(f"Chain {i+1}: {' -> '.join(chain)}")
     
     # Export for use with tools
-    export_configs(manager.working_proxies)
+    export_configs(list(manager.working_proxies), manager.working_socks_proxies)
     
     print(f"\n✅ Setup complete! {len(working_proxies)} working proxies ready.")
     print("📁 Files created:")
@@ -274,8 +496,13 @@ def main():
     print("  - proxychains.conf")
     print("  - proxy_config.json")
 
-def export_configs(proxies):
-    """Export proxy configurations for various tools"""
+def export_configs(proxies, socks_proxies=()):
+    """Export proxy configurations for various tools
+    
+    proxies are "ip:port" strings or ProxyRecs; socks_proxies are ProxyRecs,
+    which go to proxychains (it speaks SOCKS natively) and to their own key
+    in the JSON config.
+    """
     
     # Create proxychains config
     proxychains_config = """# Proxychains config for scanning
@@ -288,18 +515,22 @@ tcp_connect_time_out 8000
 [ProxyList]
 """
     
-    # Add random selection of proxies to proxychains
-    selected_proxies = random.sample(proxies, min(10, len(proxies)))
-    for proxy in selected_proxies:
-        ip, port = proxy.split(':')
-        proxychains_config += f"http {ip} {port}\n"
+    # Add random selection of proxies to proxychains; only the selected
+    # strings need parsing
+    candidates = list(proxies) + list(socks_proxies)
+    selected_proxies = [proxy if isinstance(proxy, ProxyRec) else ProxyRec.parse(proxy)
+                        for proxy in random.sample(candidates, min(10, len(candidates)))]
+    proxychains_config += "".join(
+        f"{'http' if record.protocol == 'https' else record.protocol} {record.ip} {record.port}\n"
+        for record in selected_proxies if record)
     
     with open('proxychains.conf', 'w') as f:
         f.write(proxychains_config)
     
     # Create JSON config for scripts
     config = {
-        "working_proxies": proxies,
+        "working_proxies": [proxy.proxy if isinstance(proxy, ProxyRec) else proxy for proxy in proxies],
+        "socks_proxies": [{"proxy": record.proxy, "protocol": record.protocol} for record in socks_proxies],
         "rotation_enabled": True,
         "chain_length": 3,
         "timeout": 10,
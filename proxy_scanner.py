@@ -7,6 +7,7 @@ Integrates proxy chains with popular security scanning tools
 # NOTE: Tool integration tests have been removed from the comprehensive test suite
 # due to command line argument parsing issues on Windows systems.
 # The core proxy functionality remains fully operational.
+import io
 import json
 import random
 import subprocess
@@ -14,19 +15,27 @@ import os
 import sys
 import argparse
 import time
+import traceback
 import requests
 from pathlib import Path
 
 class ProxyScanner:
-    def __init__(self, config_file="proxy_config.json"):
+    # Minimum gap in seconds between two IP checks through the same proxy
+    ROTATION_COOLDOWN = 0.5
+    
+    def __init__(self, config_file="proxy_config.json", out=None):
         self.config_file = config_file
+        # Stream for status output; None means sys.stdout at print time
+        self.out = out
         self.config = self.load_config()
         self.current_proxy = None
+        # proxy -> perf_counter() of its last IP check, for ROTATION_COOLDOWN
+        self._proxy_last_used = {}
         
     def load_config(self):
         """Load proxy configuration"""
         if not os.path.exists(self.config_file):
-            print(f"[ERROR] Config file {self.config_file} not found. Run proxy_chain_setup.py first.")
+            print(f"[ERROR] Config file {self.config_file} not found. Run proxy_chain_setup.py first.", file=self.out)
             sys.exit(1)
             
         with open(self.config_file, 'r') as f:
@@ -35,7 +44,7 @@ class ProxyScanner:
     def get_random_proxy(self):
         """Get a random working proxy"""
         if not self.config.get('working_proxies'):
-            print("[ERROR] No working proxies available")
+            print("[ERROR] No working proxies available", file=self.out)
             return None
         return random.choice(self.config['working_proxies'])
     
@@ -65,15 +74,15 @@ class ProxyScanner:
             # Quick validation before using
             if self.validate_proxy(candidate_proxy):
                 self.current_proxy = candidate_proxy
-                print(f"[+] Using proxy: {self.current_proxy}")
+                print(f"[+] Using proxy: {self.current_proxy}", file=self.out)
                 return self.current_proxy
             else:
-                print(f"[!] Proxy {candidate_proxy} failed validation, trying another...")
+                print(f"[!] Proxy {candidate_proxy} failed validation, trying another...", file=self.out)
                 
         # If all attempts failed, try without validation as fallback
         self.current_proxy = self.get_random_proxy()
         if self.current_proxy:
-            print(f"[~] Using proxy (unvalidated): {self.current_proxy}")
+            print(f"[~] Using proxy (unvalidated): {self.current_proxy}", file=self.out)
         return self.current_proxy
     
     def get_proxy_env(self):
@@ -101,7 +110,7 @@ class ProxyScanner:
         else:
             cmd = f"nmap {options} {target}"
             
-        print(f"🎯 Running: {cmd}")
+        print(f"🎯 Running: {cmd}", file=self.out)
         return self.run_command(cmd)
     
     def run_gobuster(self, target, wordlist, options="", use_proxy=True):
@@ -115,7 +124,7 @@ class ProxyScanner:
         else:
             cmd = f"gobuster dir -u {target} -w {wordlist} {options}"
             
-        print(f"🎯 Running: {cmd}")
+        print(f"🎯 Running: {cmd}", file=self.out)
         return self.run_command(cmd)
     
     def run_ffuf(self, target, wordlist, options="", use_proxy=True):
@@ -129,7 +138,7 @@ class ProxyScanner:
         else:
             cmd = f"ffuf -u {target} -w {wordlist} {options}"
             
-        print(f"🎯 Running: {cmd}")
+        print(f"🎯 Running: {cmd}", file=self.out)
         return self.run_command(cmd)
     
     def run_nuclei(self, target, options="", use_proxy=True):
@@ -143,16 +152,16 @@ class ProxyScanner:
         else:
             cmd = f"nuclei -u {target} {options}"
             
-        print(f"🎯 Running: {cmd}")
+        print(f"🎯 Running: {cmd}", file=self.out)
         return self.run_command(cmd)
     
     def run_masscan(self, target, options="", use_proxy=True):
         """Run masscan (note: doesn't support proxies directly)"""
         if use_proxy:
-            print("⚠️  Warning: masscan doesn't support proxies. Consider using nmap instead.")
+            print("⚠️  Warning: masscan doesn't support proxies. Consider using nmap instead.", file=self.out)
             
         cmd = f"masscan {options} {target}"
-        print(f"🎯 Running: {cmd}")
+        print(f"🎯 Running: {cmd}", file=self.out)
         return self.run_command(cmd)
     
     def run_curl(self, url, options="", use_proxy=True):
@@ -170,20 +179,20 @@ class ProxyScanner:
         else:
             cmd = f"curl {options} {url}"
             
-        print(f"🎯 Running: {cmd}")
+        print(f"🎯 Running: {cmd}", file=self.out)
         result = self.run_command(cmd)
         
         # If this is an IP check, also output the result cleanly
         if result and result.returncode == 0 and 'httpbin.org/ip' in url:
             if result.stdout.strip():
-                print(f"🔍 IP Result: {result.stdout.strip()}")
+                print(f"🔍 IP Result: {result.stdout.strip()}", file=self.out)
         # For headers check, show key parts for validation
         elif result and result.returncode == 0 and 'httpbin.org/headers' in url:
             if result.stdout.strip() and 'headers' in result.stdout.lower():
-                print(f"🔍 Headers Check: Success - Found headers data")
+                print(f"🔍 Headers Check: Success - Found headers data", file=self.out)
                 # Show if custom user-agent is present
                 if 'TestAgent' in result.stdout:
-                    print(f"✅ Custom User-Agent detected: TestAgent")
+                    print(f"✅ Custom User-Agent detected: TestAgent", file=self.out)
         
         return result
     
@@ -203,20 +212,20 @@ class ProxyScanner:
             )
             
             if result.returncode == 0:
-                print("✅ Command completed successfully")
+                print("✅ Command completed successfully", file=self.out)
                 if result.stdout:
-                    print("Output:", result.stdout[:500])
+                    print("Output:", result.stdout[:500], file=self.out)
             else:
-                print(f"❌ Command failed with code {result.returncode}")
+                print(f"❌ Command failed with code {result.returncode}", file=self.out)
                 if result.stderr:
-                    print("Error:", result.stderr[:500])
+                    print("Error:", result.stderr[:500], file=self.out)
                     
             return result
             
         except subprocess.TimeoutExpired:
-            print("⏰ Command timed out")
+            print("⏰ Command timed out", file=self.out)
         except Exception as e:
-            print(f"❌ Error running command: {e}")
+            print(f"❌ Error running command: {e}", file=self.out)
         
         return None
     
@@ -226,7 +235,7 @@ class ProxyScanner:
         self.rotate_proxy()
             
         if not self.current_proxy:
-            print("❌ No proxy available for testing")
+            print("❌ No proxy available for testing", file=self.out)
             return False
             
         try:
@@ -244,57 +253,171 @@ class ProxyScanner:
             if response.status_code == 200:
                 data = response.json()
                 current_ip = data.get('origin')
-                print(f"✅ Proxy {self.current_proxy} working. Current IP: {current_ip}")
+                print(f"✅ Proxy {self.current_proxy} working. Current IP: {current_ip}", file=self.out)
                 # Output JSON for easy parsing
-                print(f'{{"origin": "{current_ip}"}}')
+                print(f'{{"origin": "{current_ip}"}}', file=self.out)
                 return True
             else:
-                print(f"❌ Proxy {self.current_proxy} returned status {response.status_code}")
+                print(f"❌ Proxy {self.current_proxy} returned status {response.status_code}", file=self.out)
                 
         except Exception as e:
-            print(f"❌ Proxy {self.current_proxy} failed: {e}")
+            print(f"❌ Proxy {self.current_proxy} failed: {e}", file=self.out)
             # Try fallback without proxy to check connectivity
             try:
                 fallback_response = requests.get('http://httpbin.org/ip', timeout=10)
                 if fallback_response.status_code == 200:
                     fallback_data = fallback_response.json()
-                    print(f"⚠️ Fallback direct connection. IP: {fallback_data.get('origin')}")
-                    print(f'{{"origin": "{fallback_data.get("origin")}"}}')
+                    print(f"⚠️ Fallback direct connection. IP: {fallback_data.get('origin')}", file=self.out)
+                    print(f'{{"origin": "{fallback_data.get("origin")}"}}', file=self.out)
             except:
                 pass
             
         return False
 
-def main():
-    parser = argparse.ArgumentParser(description="Proxy-enabled Security Scanner")
-    parser.add_argument('tool', choices=['nmap', 'gobuster', 'ffuf', 'nuclei', 'curl', 'test'], 
+    def _check_ip(self):
+        """Rotate proxies and return the IP httpbin sees through the new one, or None"""
+        self.rotate_proxy()
+        if not self.current_proxy:
+            return None
+        self._cool_down(self.current_proxy)
+        try:
+            proxy_dict = {
+                'http': f'http://{self.current_proxy}',
+                'https': f'http://{self.current_proxy}'
+            }
+            response = requests.get('http://httpbin.org/ip', proxies=proxy_dict, timeout=10)
+            if response.status_code == 200:
+                return response.json().get('origin')
+        except Exception as e:
+            print(f"❌ Proxy {self.current_proxy} failed: {e}", file=self.out)
+        return None
+    
+    def _cool_down(self, proxy):
+        """Sleep only if `proxy` was checked less than ROTATION_COOLDOWN ago"""
+        last_used = self._proxy_last_used.get(proxy)
+        if last_used is not None:
+            delay = self.ROTATION_COOLDOWN - (time.perf_counter() - last_used)
+            if delay > 0:
+                time.sleep(delay)
+        self._proxy_last_used[proxy] = time.perf_counter()
+    
+    def _curl_ip(self):
+        """Return the IP reported by curl through a freshly rotated proxy, or None"""
+        result = self.run_curl('http://httpbin.org/ip')
+        if result and result.returncode == 0:
+            try:
+                return json.loads(result.stdout).get('origin')
+            except (ValueError, AttributeError):
+                pass
+        return None
+    
+    def run_batch(self, count):
+        """Run `count` proxy rotations in one process and print them as a JSON array
+        
+        Each entry is {"ip", "method", "duration"}; curl is only tried when
+        the direct check fails, and ip/method are None if both do. The array
+        is printed last, on a line of its own.
+        """
+        results = []
+        for _ in range(count):
+            start_time = time.perf_counter()
+            ip, method = self._check_ip(), "test"
+            if not ip:
+                ip, method = self._curl_ip(), "curl"
+            results.append({
+                "ip": ip,
+                "method": method if ip else None,
+                "duration": round(time.perf_counter() - start_time, 2)
+            })
+        print(json.dumps(results), file=self.out)
+        return results
+
+class _StreamArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that writes help to `out` and usage errors to `err`
+    instead of the process-wide sys.stdout/sys.stderr"""
+    
+    def __init__(self, *args, out=None, err=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.out = out
+        self.err = err
+    
+    def _print_message(self, message, file=None):
+        stream = self.err if file is sys.stderr else self.out
+        super()._print_message(message, stream or file)
+
+def _capture(action, config_file):
+    """Run a scanner action with its output captured and return that output"""
+    buffer = io.StringIO()
+    try:
+        action(ProxyScanner(config_file, out=buffer))
+    except SystemExit:
+        # load_config exits when the config is missing; the reason is in the buffer
+        pass
+    return buffer.getvalue()
+
+def run_test(config_file="proxy_config.json"):
+    """In-process equivalent of `proxy_scanner.py test`, returning its output"""
+    return _capture(lambda scanner: scanner.test_proxy_connectivity(), config_file)
+
+def run_curl(url, options="", config_file="proxy_config.json"):
+    """In-process equivalent of `proxy_scanner.py curl URL`, returning its output"""
+    return _capture(lambda scanner: scanner.run_curl(url, options), config_file)
+
+def run(argv):
+    """In-process equivalent of `proxy_scanner.py ARGV...`
+    
+    Returns (stdout, stderr, returncode) like a finished subprocess would.
+    Argument errors and a missing config exit the CLI; those are turned
+    back into a return code here.
+    """
+    out = io.StringIO()
+    err = io.StringIO()
+    returncode = 0
+    try:
+        main(argv, out=out, err=err)
+    except SystemExit as e:
+        returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+    except Exception:
+        err.write(traceback.format_exc())
+        returncode = 1
+    return out.getvalue(), err.getvalue(), returncode
+
+def main(argv=None, out=None, err=None):
+    parser = _StreamArgumentParser(prog="proxy_scanner.py", description="Proxy-enabled Security Scanner",
+                                   out=out, err=err)
+    parser.add_argument('tool', choices=['nmap', 'gobuster', 'ffuf', 'nuclei', 'curl', 'test', 'batch'], 
                        help='Scanning tool to run')
     parser.add_argument('target', help='Target URL or IP')
     parser.add_argument('--wordlist', '-w', help='Wordlist file (for gobuster/ffuf)')
     parser.add_argument('--options', '-o', default='', help='Additional tool options')
     parser.add_argument('--no-proxy', action='store_true', help='Disable proxy usage')
     parser.add_argument('--config', default='proxy_config.json', help='Proxy config file')
+    parser.add_argument('--count', type=int, default=10, help='Rotations to run (for batch)')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
-    scanner = ProxyScanner(args.config)
+    scanner = ProxyScanner(args.config, out=out)
     use_proxy = not args.no_proxy
     
     if args.tool == 'test':
         scanner.test_proxy_connectivity()
         return
     
+    if args.tool == 'batch':
+        scanner.run_batch(args.count)
+        return
+    
     # Tool-specific execution
     if args.tool == 'nmap':
         scanner.run_nmap(args.target, args.options, use_proxy)
     elif args.tool == 'gobuster':
         if not args.wordlist:
-            print("❌ Wordlist required for gobuster")
+            print("❌ Wordlist required for gobuster", file=out)
             sys.exit(1)
         scanner.run_gobuster(args.target, args.wordlist, args.options, use_proxy)
     elif args.tool == 'ffuf':
         if not args.wordlist:
-            print("❌ Wordlist required for ffuf")
+            print("❌ Wordlist required for ffuf", file=out)
             sys.exit(1)
         scanner.run_ffuf(args.target, args.wordlist, args.options, use_proxy)
     elif args.tool == 'nuclei':
@@ -311,6 +434,7 @@ if __name__ == "__main__":
         print("python proxy_scanner.py gobuster https://example.com -w /path/to/wordlist")
         print("python proxy_scanner.py nuclei https://example.com")
         print("python proxy_scanner.py curl https://httpbin.org/ip")
+        print("python proxy_scanner.py batch httpbin.org --count 10")
         print("\nFirst run proxy_chain_setup.py to initialize proxies!")
         sys.exit(1)
         
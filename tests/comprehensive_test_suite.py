@@ -7,21 +7,63 @@ Improved parsing, validation, and more reliable testing
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
 import os
 import sys
 import re
+import socket
 import threading
 from datetime import datetime
 from pathlib import Path
-import statistics
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import cycle, islice, repeat
+from functools import lru_cache
+# proxy_scanner lives in the project root; import it so rotation checks run
+# in-process instead of paying for a fresh interpreter on every call
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+try:
+    import proxy_scanner
+except ImportError:
+    proxy_scanner = None
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder if orjson is not installed
+    orjson = None
 
 class ProxyChainTester:
+    # Regexes are compiled once when the class is defined and shared by all instances
+    IP_PATTERN = re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b')
+    
+    # IP extraction patterns, in order of preference, combined into one
+    # alternation with a named group per pattern so a single finditer pass
+    # sees every candidate; the earliest-listed group with a valid IP wins
+    EXTRACT_PATTERN = re.compile('|'.join((
+        r'\{"origin":\s*"(?P<p0>[^"]+)"\}',               # Clean JSON format
+        r'Current IP:\s*(?P<p1>[0-9.]+)',
+        r'"origin":\s*"(?P<p2>[^"]+)"',
+        r'"origin"\s*:\s*"(?P<p3>[^"]+)"',                # JSON format
+        r'IP Result:\s*\{"origin":\s*"(?P<p4>[^"]+)"\}',  # Curl result format
+        r'Current IP:\s*(?P<p5>\S+)',                     # Status output
+        r'origin":\s*"(?P<p6>[^"]+)"',                    # Partial JSON
+        r'IP:\s*(?P<p7>[0-9.]+)',                         # Direct IP format
+        r'(?P<bare>\b(?:\d{1,3}\.){3}\d{1,3}\b)',          # Fallback: any address
+    )))
+    
+    # Scanner runs allowed in flight at once during the rotation test, and
+    # the minimum spacing between rotation starts
+    ROTATION_WORKERS = 3
+    ROTATION_MIN_GAP = 0.5
+    
     def __init__(self):
         self.config_file = "proxy_config.json"
+        # Read the clock once; the banner, report and filename all reuse it
+        self._start_dt = datetime.now()
+        self._start_iso = self._start_dt.isoformat()
+        self._start_tag = self._start_dt.strftime('%Y%m%d_%H%M%S')
         self.results = {
-            "test_start_time": datetime.now().isoformat(),
+            "test_start_time": self._start_iso,
             "basic_connectivity": {},
             "ip_rotation": {},
             "performance_metrics": {},
@@ -32,63 +74,63 @@ class ProxyChainTester:
             "summary": {}
         }
         self.load_config()
-        self.test_patterns = {
-            "ip_pattern": r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
-            "current_ip_pattern": r'Current IP:\s*([0-9.]+)',
-            "origin_pattern": r'"origin":\s*"([^"]+)"'
-        }
         
-    def validate_ip_address(self, ip_string):
+        # One pooled session for every probe; the adapter keeps a separate
+        # keep-alive pool per proxy URL, so repeat requests skip the handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self._proxy_dicts = {}
+        
+        # Shared by every concurrent test so threads are started once per run;
+        # sized to cover the 15-request stress test
+        self._executor = ThreadPoolExecutor(max_workers=min(32, max(16, 4 * len(self.working_proxies))))
+        
+    def close(self):
+        """Shut down the shared worker pool; the tester can't run tests after this"""
+        self._executor.shutdown()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+        
+    @staticmethod
+    def validate_ip_address(ip_string):
         """Validate if string contains a valid IP address"""
         if not ip_string or isinstance(ip_string, str) and "Error" in ip_string:
             return False
         
         # Extract IP using regex
-        ip_match = re.search(self.test_patterns["ip_pattern"], str(ip_string))
+        ip_match = ProxyChainTester.IP_PATTERN.search(str(ip_string))
         if not ip_match:
             return False
-            
-        ip = ip_match.group()
-        parts = ip.split('.')
         
+        # inet_pton range-checks every octet in a single C call
         try:
-            return all(0 <= int(part) <= 255 for part in parts)
-        except ValueError:
+            socket.inet_pton(socket.AF_INET, ip_match.group())
+            return True
+        except OSError:
             return False
     
+    def _pack_ip(self, ip_string):
+        """Pack the first IPv4 address in an already-validated string into an int"""
+        ip = self.IP_PATTERN.search(ip_string).group()
+        return int.from_bytes(socket.inet_pton(socket.AF_INET, ip), 'big')
+    
     def extract_ip_from_output(self, output_text):
         """Enhanced IP extraction with multiple patterns"""
         if not output_text:
             return None
-            
-        # Try different patterns in order of preference
-        patterns = [
-            r'\{"origin":\s*"([^"]+)"\}',  # Clean JSON format
-            self.test_patterns["current_ip_pattern"],
-            self.test_patterns["origin_pattern"],
-            r'"origin"\s*:\s*"([^"]+)"',  # JSON format
-            r'IP Result:\s*\{"origin":\s*"([^"]+)"\}',  # Curl result format
-            r'Current IP:\s*(\S+)',       # Status output
-            r'origin":\s*"([^"]+)"',       # Partial JSON
-            r'IP:\s*([0-9.]+)',            # Direct IP format
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output_text)
-            if match:
-                potential_ip = match.group(1).strip()
-                if self.validate_ip_address(potential_ip):
-                    return potential_ip
-        
-        # Fallback: look for any valid IP in the text
-        ip_matches = re.findall(self.test_patterns["ip_pattern"], output_text)
-        for potential_ip in ip_matches:
-            if self.validate_ip_address(potential_ip):
-                # Skip common non-routable IPs that might be noise
-                if not potential_ip.startswith(('127.', '169.254.', '0.', '255.')):
-                    return potential_ip
-                
-        return None
+        return _scan_ips_cached(output_text)[0]
+        
+    def extract_all_ips_from_output(self, output_text):
+        """Return every valid IP reported in the output, in order and without duplicates"""
+        if not output_text:
+            return []
+        return list(_scan_ips_cached(output_text)[1])
         
     def load_config(self):
         """Load proxy configuration"""
@@ -106,7 +148,7 @@ class ProxyChainTester:
         print("=" * 80)
         print("🧪 Pr0Xy-chaIN COMPREHENSIVE TEST SUITE")
         print("=" * 80)
-        print(f"📅 Test Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        print(f"📅 Test Started: {self._start_dt.strftime('%Y-%m-%d %H:%M:%S')}")
         print(f"🔗 Available Proxies: {len(self.working_proxies)}")
         print("=" * 80)
         print()
@@ -114,27 +156,45 @@ class ProxyChainTester:
     def get_current_ip_direct(self):
         """Get current IP without proxy"""
         try:
-            response = requests.get('http://httpbin.org/ip', timeout=10)
+            response = self.session.get('http://httpbin.org/ip', timeout=10)
             if response.status_code == 200:
                 return response.json().get('origin')
         except Exception as e:
             return f"Error: {e}"
         return None
     
+    def _proxy_dict(self, proxy):
+        """Return the requests proxies mapping for a proxy, built once per proxy"""
+        proxy_dict = self._proxy_dicts.get(proxy)
+        if proxy_dict is None:
+            proxy_url = f'http://{proxy}'
+            proxy_dict = self._proxy_dicts.setdefault(proxy, {'http': proxy_url, 'https': proxy_url})
+        return proxy_dict
+    
     def get_current_ip_with_proxy(self, proxy):
         """Get current IP using specific proxy"""
         try:
-            proxy_dict = {
-                'http': f'http://{proxy}',
-                'https': f'http://{proxy}'
-            }
-            response = requests.get('http://httpbin.org/ip', proxies=proxy_dict, timeout=15)
+            response = self.session.get('http://httpbin.org/ip', proxies=self._proxy_dict(proxy), timeout=15)
             if response.status_code == 200:
                 return response.json().get('origin')
         except Exception as e:
             return f"Error: {e}"
         return None
     
+    def _probe_proxy(self, proxy, direct_ip):
+        """Time one request through a proxy and build its connectivity result"""
+        start_time = time.perf_counter()
+        proxy_ip = self.get_current_ip_with_proxy(proxy)
+        response_time = time.perf_counter() - start_time
+        
+        return {
+            "proxy": proxy,
+            "ip": proxy_ip,
+            "response_time": round(response_time, 2),
+            "working": "Error" not in str(proxy_ip),
+            "ip_changed": proxy_ip != direct_ip and "Error" not in str(proxy_ip)
+        }
+    
     def test_basic_connectivity(self):
         """Test 1: Basic proxy connectivity"""
         print("🔍 TEST 1: Basic Proxy Connectivity")
@@ -146,91 +206,138 @@ class ProxyChainTester:
         
         self.results["basic_connectivity"]["direct_ip"] = direct_ip
         self.results["basic_connectivity"]["proxy_tests"] = []
-        
-        for i, proxy in enumerate(self.working_proxies, 1):
-            print(f"\n🔗 Testing Proxy {i}/{len(self.working_proxies)}: {proxy}")
-            start_time = time.time()
-            
-            proxy_ip = self.get_current_ip_with_proxy(proxy)
-            response_time = time.time() - start_time
-            
-            test_result = {
-                "proxy": proxy,
-                "ip": proxy_ip,
-                "response_time": round(response_time, 2),
-                "working": "Error" not in str(proxy_ip),
-                "ip_changed": proxy_ip != direct_ip and "Error" not in str(proxy_ip)
-            }
-            
+        working_count = 0
+        
+        # Probe every proxy at once on the shared pool; map yields results in
+        # proxy order, so the output reads the same as a serial run
+        probes = self._executor.map(self._probe_proxy, self.working_proxies,
+                                    repeat(direct_ip, len(self.working_proxies)))
+        for i, test_result in enumerate(probes, 1):
+            proxy_ip = test_result["ip"]
+            print(f"\n🔗 Testing Proxy {i}/{len(self.working_proxies)}: {test_result['proxy']}")
             if test_result["working"]:
-                print(f"✅ Working - IP: {proxy_ip} | Response: {response_time:.2f}s")
+                working_count += 1
+                print(f"✅ Working - IP: {proxy_ip} | Response: {test_result['response_time']:.2f}s")
             else:
                 print(f"❌ Failed - {proxy_ip}")
                 
             self.results["basic_connectivity"]["proxy_tests"].append(test_result)
         
-        working_count = sum(1 for t in self.results["basic_connectivity"]["proxy_tests"] if t["working"])
+        # Keep the tallies so the final report doesn't have to recount them
+        self.results["basic_connectivity"]["total_tested"] = len(self.working_proxies)
+        self.results["basic_connectivity"]["working_count"] = working_count
         print(f"\n📊 Summary: {working_count}/{len(self.working_proxies)} proxies working")
         
+    def _run_scanner(self, tool, target):
+        """Run a proxy_scanner action and return its stdout
+        
+        Calls the scanner in-process when it could be imported, otherwise
+        falls back to launching it as a subprocess.
+        """
+        if proxy_scanner:
+            if tool == 'test':
+                return proxy_scanner.run_test(self.config_file)
+            return proxy_scanner.run_curl(target, config_file=self.config_file)
+        
+        result = subprocess.run([
+            sys.executable, 'proxy_scanner.py', tool, target
+        ], capture_output=True, text=True, timeout=30)
+        return result.stdout
+    
+    def _wait_for_rotation_slot(self):
+        """Space rotation starts ROTATION_MIN_GAP apart, sleeping only if needed"""
+        with self._rotation_lock:
+            wait = self._last_rotation_start + self.ROTATION_MIN_GAP - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_rotation_start = time.monotonic()
+    
+    def _run_rotation(self, rotation, total):
+        """Run one rotation, keeping at most ROTATION_WORKERS scanner runs in flight"""
+        with self._rotation_slots:
+            self._wait_for_rotation_slot()
+            return self._rotate(rotation, total)
+    
+    def _rotate(self, rotation, total):
+        """Run one rotation through proxy_scanner and return its result record"""
+        label = f"🎲 Rotation {rotation}/{total} - "
+        
+        # Use proxy scanner to get random proxy
+        try:
+            output = self._run_scanner('test', 'httpbin.org')
+            
+            # Enhanced parsing with multiple methods; anything returned has
+            # already passed validate_ip_address
+            ip = self.extract_ip_from_output(output)
+            
+            if ip:
+                print(f"{label}✅ IP: {ip}")
+                return {"rotation": rotation, "ip": ip, "success": True,
+                        "reported_ips": self.extract_all_ips_from_output(output)}
+            
+            # Try alternative method
+            alt_output = self._run_scanner('curl', 'http://httpbin.org/ip')
+            
+            alt_ip = self.extract_ip_from_output(alt_output)
+            if alt_ip:
+                print(f"{label}✅ IP: {alt_ip} (via curl)")
+                return {"rotation": rotation, "ip": alt_ip, "success": True,
+                        "reported_ips": self.extract_all_ips_from_output(alt_output)}
+            
+            print(f"{label}❌ Failed to get IP")
+            return {"rotation": rotation, "ip": None, "success": False}
+                
+        except Exception as e:
+            print(f"{label}Error: {e}")
+            return {"rotation": rotation, "ip": None, "success": False, "error": str(e)}
+    
     def test_ip_rotation(self):
         """Test 2: IP rotation and randomization"""
         print("\n🔄 TEST 2: IP Rotation and Randomization")
         print("-" * 50)
         
-        rotation_results = []
-        unique_ips = set()
+        rotations = 10
+        self._rotation_lock = threading.Lock()
+        self._rotation_slots = threading.BoundedSemaphore(self.ROTATION_WORKERS)
+        self._last_rotation_start = float('-inf')
         
-        # Test multiple rotations
-        for i in range(10):
-            print(f"🎲 Rotation {i+1}/10", end=" - ")
-            
-            # Use proxy scanner to get random proxy
-            try:
-                result = subprocess.run([
-                    'python', 'proxy_scanner.py', 'test', 'httpbin.org'
-                ], capture_output=True, text=True, timeout=30)
-                
-                # Enhanced parsing with multiple methods
-                output = result.stdout
-                ip = self.extract_ip_from_output(output)
-                
-                if ip and self.validate_ip_address(ip):
-                    unique_ips.add(ip)
-                    print(f"✅ IP: {ip}")
-                    rotation_results.append({"rotation": i+1, "ip": ip, "success": True})
-                else:
-                    # Try alternative method
-                    alt_result = subprocess.run([
-                        'python', 'proxy_scanner.py', 'curl', 'http://httpbin.org/ip'
-                    ], capture_output=True, text=True, timeout=30)
-                    
-                    alt_ip = self.extract_ip_from_output(alt_result.stdout)
-                    if alt_ip and self.validate_ip_address(alt_ip):
-                        unique_ips.add(alt_ip)
-                        print(f"✅ IP: {alt_ip} (via curl)")
-                        rotation_results.append({"rotation": i+1, "ip": alt_ip, "success": True})
-                    else:
-                        print("❌ Failed to get IP")
-                        rotation_results.append({"rotation": i+1, "ip": None, "success": False})
-                    
-            except Exception as e:
-                print(f"Error: {e}")
-                rotation_results.append({"rotation": i+1, "ip": None, "success": False, "error": str(e)})
-            
-            time.sleep(2)  # Small delay between rotations
+        # Each rotation is an independent scanner run, so launch a few at a
+        # time instead of one after another
+        rotation_results = list(self._executor.map(self._run_rotation,
+                                                   range(1, rotations + 1),
+                                                   repeat(rotations, rotations)))
+        
+        # Track IPs as packed 32-bit ints: cheap to hash, and the /24 of each
+        # is a single shift away
+        unique_ips = {self._pack_ip(r["ip"]) for r in rotation_results if r["success"]}
+        unique_ip_list = [socket.inet_ntoa(ip.to_bytes(4, 'big')) for ip in unique_ips]
         
         self.results["ip_rotation"] = {
-            "total_rotations": 10,
+            "total_rotations": rotations,
             "successful_rotations": sum(1 for r in rotation_results if r["success"]),
             "unique_ips": len(unique_ips),
-            "unique_ip_list": list(unique_ips),
+            "unique_subnets": len({ip >> 8 for ip in unique_ips}),
+            "unique_ip_list": unique_ip_list,
             "rotation_details": rotation_results
         }
         
         print(f"\n📊 Rotation Summary:")
-        print(f"   ✅ Successful: {self.results['ip_rotation']['successful_rotations']}/10")
+        print(f"   ✅ Successful: {self.results['ip_rotation']['successful_rotations']}/{rotations}")
         print(f"   🎯 Unique IPs: {len(unique_ips)}")
-        print(f"   📍 IPs Found: {', '.join(list(unique_ips)[:5])}{'...' if len(unique_ips) > 5 else ''}")
+        print(f"   📍 IPs Found: {', '.join(unique_ip_list[:5])}{'...' if len(unique_ips) > 5 else ''}")
+    
+    @staticmethod
+    def _summarize_times(times):
+        """Return (average, min, max) of a non-empty list of timings in one pass"""
+        total = 0.0
+        fastest = slowest = times[0]
+        for t in times:
+            total += t
+            if t < fastest:
+                fastest = t
+            elif t > slowest:
+                slowest = t
+        return total / len(times), fastest, slowest
     
     def test_performance_metrics(self):
         """Test 3: Performance and response time metrics"""
@@ -246,9 +353,9 @@ class ProxyChainTester:
         # Test direct connection speed (baseline)
         print("📊 Testing direct connection speed...")
         for i in range(5):
-            start = time.time()
+            start = time.perf_counter()
             ip = self.get_current_ip_direct()
-            duration = time.time() - start
+            duration = time.perf_counter() - start
             performance_data["direct_connection"].append(duration)
             print(f"   Direct test {i+1}: {duration:.2f}s")
         
@@ -259,24 +366,26 @@ class ProxyChainTester:
             print(f"🔗 Testing proxy: {proxy}")
             
             for i in range(3):
-                start = time.time()
+                start = time.perf_counter()
                 ip = self.get_current_ip_with_proxy(proxy)
-                duration = time.time() - start
+                duration = time.perf_counter() - start
                 proxy_times.append(duration)
                 print(f"   Proxy test {i+1}: {duration:.2f}s")
             
+            average, fastest, slowest = self._summarize_times(proxy_times)
             performance_data["proxy_connections"].append({
                 "proxy": proxy,
                 "times": proxy_times,
-                "average": statistics.mean(proxy_times),
-                "min": min(proxy_times),
-                "max": max(proxy_times)
+                "average": average,
+                "min": fastest,
+                "max": slowest
             })
         
         # Calculate averages
-        direct_avg = statistics.mean(performance_data["direct_connection"])
+        direct_times = performance_data["direct_connection"]
+        direct_avg = sum(direct_times) / len(direct_times)
         proxy_avgs = [p["average"] for p in performance_data["proxy_connections"]]
-        overall_proxy_avg = statistics.mean(proxy_avgs) if proxy_avgs else 0
+        overall_proxy_avg = sum(proxy_avgs) / len(proxy_avgs) if proxy_avgs else 0
         
         performance_data["comparison"] = {
             "direct_average": round(direct_avg, 2),
@@ -299,13 +408,9 @@ class ProxyChainTester:
         def make_request(proxy, request_id):
             """Make a single request through proxy"""
             try:
-                start_time = time.time()
-                proxy_dict = {
-                    'http': f'http://{proxy}',
-                    'https': f'http://{proxy}'
-                }
-                response = requests.get('http://httpbin.org/ip', proxies=proxy_dict, timeout=20)
-                duration = time.time() - start_time
+                start_time = time.perf_counter()
+                response = self.session.get('http://httpbin.org/ip', proxies=self._proxy_dict(proxy), timeout=20)
+                duration = time.perf_counter() - start_time
                 
                 if response.status_code == 200:
                     ip = response.json().get('origin')
@@ -316,6 +421,12 @@ class ProxyChainTester:
                         'ip': ip,
                         'response_time': duration
                     }
+                return {
+                    'request_id': request_id,
+                    'proxy': proxy,
+                    'success': False,
+                    'error': f"Status {response.status_code}"
+                }
             except Exception as e:
                 return {
                     'request_id': request_id,
@@ -325,33 +436,33 @@ class ProxyChainTester:
                 }
         
         # Test with 15 concurrent requests
-        concurrent_results = []
-        print("📡 Launching 15 concurrent requests...")
-        
-        with ThreadPoolExecutor(max_workers=5) as executor:
-            futures = []
-            
-            for i in range(15):
-                proxy = self.working_proxies[i % len(self.working_proxies)] if self.working_proxies else None
-                if proxy:
-                    future = executor.submit(make_request, proxy, i+1)
-                    futures.append(future)
-            
-            for future in as_completed(futures):
-                result = future.result()
-                concurrent_results.append(result)
-                status = "✅" if result.get('success') else "❌"
-                print(f"   {status} Request {result['request_id']}: {result.get('ip', 'Failed')}")
+        concurrent_requests = 15
+        print(f"📡 Launching {concurrent_requests} concurrent requests...")
+        
+        # The shared pool has a worker per request, so they all overlap
+        # instead of running in waves
+        assigned = islice(cycle(self.working_proxies), concurrent_requests)
+        futures = [self._executor.submit(make_request, proxy, request_id)
+                   for request_id, proxy in enumerate(assigned, 1)]
+        
+        # Slots are filled by request id as futures finish, so the details
+        # come out in request order without sorting
+        concurrent_results = [None] * len(futures)
+        for future in as_completed(futures):
+            result = future.result()
+            concurrent_results[result['request_id'] - 1] = result
+            status = "✅" if result.get('success') else "❌"
+            print(f"   {status} Request {result['request_id']}: {result.get('ip', 'Failed')}")
         
         successful = sum(1 for r in concurrent_results if r and r.get('success'))
         response_times = [r['response_time'] for r in concurrent_results if r and r.get('response_time')]
-        avg_response_time = statistics.mean(response_times) if response_times else 0
+        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
         
         self.results["stress_tests"] = {
-            "concurrent_requests": 15,
+            "concurrent_requests": concurrent_requests,
             "successful_requests": successful,
-            "failed_requests": 15 - successful,
-            "success_rate": round((successful / 15) * 100, 2),
+            "failed_requests": concurrent_requests - successful,
+            "success_rate": round((successful / concurrent_requests) * 100, 2),
             "average_response_time": round(avg_response_time, 2),
             "request_details": concurrent_results
         }
@@ -387,10 +498,10 @@ class ProxyChainTester:
         print("🔍 Testing timeout handling...")
         try:
             proxy_dict = {'http': 'http://10.255.255.1:8080', 'https': 'http://10.255.255.1:8080'}
-            start_time = time.time()
+            start_time = time.perf_counter()
             requests.get('http://httpbin.org/ip', proxies=proxy_dict, timeout=3)
         except requests.exceptions.Timeout:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             error_tests.append({
                 "test": "timeout_handling",
                 "duration": duration,
@@ -438,6 +549,25 @@ class ProxyChainTester:
         total = self.results["error_handling"]["total_error_tests"]
         print(f"\n📊 Error Handling Summary: {handled}/{total} cases handled gracefully")
     
+    def _run_bounded(self, command, limit=4096, timeout=30):
+        """Run a command keeping only the first `limit` bytes of its stdout
+        
+        The rest of the output is drained and discarded rather than buffered,
+        and the process is killed if it outlives `timeout`. Returns
+        (returncode, text).
+        """
+        with subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL) as proc:
+            timer = threading.Timer(timeout, proc.kill)
+            timer.start()
+            try:
+                head = proc.stdout.read(limit)
+                while proc.stdout.read(65536):
+                    pass
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+        return returncode, head.decode(errors='replace')
+    
     def test_daemon_functionality(self):
         """Test 7: Daemon functionality"""
         print("\n🔄 TEST 7: Daemon Functionality")
@@ -448,17 +578,15 @@ class ProxyChainTester:
         # Test daemon status
         print("🔍 Checking daemon status...")
         try:
-            result = subprocess.run([
-                'python', 'proxy_status.py'
-            ], capture_output=True, text=True, timeout=30)
+            returncode, output = self._run_bounded(['python', 'proxy_status.py'], timeout=30)
             
             daemon_tests.append({
                 "test": "daemon_status_check",
-                "success": result.returncode == 0,
-                "output": result.stdout[:200]
+                "success": returncode == 0,
+                "output": output[:200]
             })
             
-            if result.returncode == 0:
+            if returncode == 0:
                 print("   ✅ Daemon status check successful")
             else:
                 print("   ❌ Daemon status check failed")
@@ -505,8 +633,8 @@ class ProxyChainTester:
         
         # Basic connectivity score
         if self.results.get("basic_connectivity"):
-            connectivity_tests = len(self.results["basic_connectivity"].get("proxy_tests", []))
-            connectivity_passed = sum(1 for t in self.results["basic_connectivity"]["proxy_tests"] if t["working"])
+            connectivity_tests = self.results["basic_connectivity"]["total_tested"]
+            connectivity_passed = self.results["basic_connectivity"]["working_count"]
             total_tests += connectivity_tests
             passed_tests += connectivity_passed
             print(f"\n🔍 CONNECTIVITY: {connectivity_passed}/{connectivity_tests} proxies working ({connectivity_passed/connectivity_tests*100:.1f}%)")
@@ -566,9 +694,12 @@ class ProxyChainTester:
         print(f"{'='*50}")
         
         # Save detailed report
-        report_file = f"test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        report_file = f"test_report_{self._start_tag}.json"
+        if orjson:
+            Path(report_file).write_bytes(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(self.results, f, indent=2)
         
         print(f"📄 Detailed report saved to: {report_file}")
         
@@ -594,6 +725,36 @@ class ProxyChainTester:
         except Exception as e:
             print(f"\n❌ Test suite failed with error: {e}")
             return None
+        finally:
+            self.close()
+
+@lru_cache(maxsize=512)
+def _scan_ips_cached(output_text):
+    """Single EXTRACT_PATTERN pass behind extract_ip_from_output and
+    extract_all_ips_from_output: (preferred IP or None, every reported IP).
+    Memoized because rotation and stress runs often parse identical
+    scanner/httpbin text, and a rotation asks for both results"""
+    groups = ProxyChainTester.EXTRACT_PATTERN.groupindex
+    preferred = {}
+    reported = {}
+    for match in ProxyChainTester.EXTRACT_PATTERN.finditer(output_text):
+        kind = match.lastgroup
+        potential_ip = match.group(kind).strip()
+        if kind == 'bare':
+            # Skip common non-routable IPs that might be noise
+            if potential_ip.startswith(('127.', '169.254.', '0.', '255.')):
+                continue
+        else:
+            # An "origin" can list several hops ("client, proxy")
+            for ip in potential_ip.split(','):
+                ip = ip.strip()
+                if ProxyChainTester.validate_ip_address(ip):
+                    reported[ip] = None
+        if kind not in preferred and ProxyChainTester.validate_ip_address(potential_ip):
+            preferred[kind] = potential_ip
+    
+    best = preferred[min(preferred, key=groups.get)] if preferred else None
+    return best, tuple(reported)
 
 def main():
     tester = ProxyChainTester()
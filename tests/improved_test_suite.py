@@ -7,19 +7,95 @@ Enhanced with better parsing, validation, and more reliable testing
 import json
 import time
 import requests
+from requests.adapters import HTTPAdapter
 import subprocess
 import os
 import sys
 import re
 import threading
+import socket
+import logging
+import shlex
+import functools
+import itertools
 from datetime import datetime
 from pathlib import Path
 import statistics
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+import io
+import traceback
+try:
+    import orjson
+except ImportError:
+    # Fall back to the stdlib encoder if orjson is not installed
+    orjson = None
+# proxy_scanner lives in the project root and the status manager in
+# benchmarks/; import them so their CLI checks can run in-process instead
+# of paying for a fresh interpreter on every call
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+sys.path.insert(0, str(_ROOT / 'benchmarks'))
+try:
+    import proxy_scanner
+except ImportError:
+    proxy_scanner = None
+try:
+    import improved_proxy_status
+except ImportError:
+    improved_proxy_status = None
+
+# Chatty per-command traces go through this logger at DEBUG level; main()
+# enables them with --verbose
+logger = logging.getLogger("proxytest")
+
+def _loads_json(data):
+    """Decode command output JSON; both decoders raise json.JSONDecodeError"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+@functools.lru_cache(maxsize=1)
+def _load_config(path, mtime):
+    """Parse the proxy config; keyed on mtime so an edited file is re-read"""
+    with open(path, 'r') as f:
+        return json.load(f)
 
 class ImprovedProxyChainTester:
-    def __init__(self):
+    # Regexes are compiled once when the class is defined and shared by all instances
+    test_patterns = {
+        "ip_pattern": re.compile(r'\b(?:\d{1,3}\.){3}\d{1,3}\b'),
+        "current_ip_pattern": re.compile(r'Current IP:\s*([0-9.]+)'),
+        "origin_pattern": re.compile(r'"origin":\s*"([^"]+)"')
+    }
+    
+    # Every IP source in one alternation, so extraction scans the output once:
+    # status lines, then JSON "origin" fields (quoted key or partial), then
+    # any bare address
+    EXTRACT_PATTERN = re.compile(
+        r'Current IP:\s*(?P<current>[0-9.]+)'
+        r'|origin"\s*:\s*"(?P<origin>[^"]+)"'
+        r'|(?P<bare>\b(?:\d{1,3}\.){3}\d{1,3}\b)'
+    )
+    
+    # improved_proxy_status.py actions that write only through main()'s out
+    # stream; start/stop/restart print directly, so they run as subprocesses
+    IN_PROCESS_STATUS_ACTIONS = ("status", "health", "repair")
+    # Stress requests skip proxies whose health (an EWMA of request success,
+    # weighted PROXY_HEALTH_WEIGHT per new result) is at or below this floor
+    PROXY_HEALTH_FLOOR = 0.3
+    PROXY_HEALTH_WEIGHT = 0.1
+    
+    def __init__(self, use_subprocess=False, sequential=False):
         self.config_file = "proxy_config.json"
+        # Run scanner/status commands as real subprocesses, for isolation
+        self.use_subprocess = use_subprocess
+        # Run the three original tests one after another instead of concurrently
+        self.sequential = sequential
+        # Comprehensive-suite tester the original tests are delegated to;
+        # built on first use and shared by all three
+        self._original_tester = None
+        # proxy -> health score in [0, 1]; untracked proxies count as healthy
+        self._proxy_health = {}
         self.results = {
             "test_start_time": datetime.now().isoformat(),
             "basic_connectivity": {},
@@ -32,24 +108,27 @@ class ImprovedProxyChainTester:
             "summary": {}
         }
         self.load_config()
-        self.test_patterns = {
-            "ip_pattern": r'\b(?:\d{1,3}\.){3}\d{1,3}\b',
-            "current_ip_pattern": r'Current IP:\s*([0-9.]+)',
-            "origin_pattern": r'"origin":\s*"([^"]+)"'
-        }
+        
+        # One pooled session for every stress-test request; the adapter keeps
+        # a keep-alive pool per proxy, so repeat requests skip the handshake
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
     def load_config(self):
         """Load proxy configuration with validation"""
         try:
-            if not os.path.exists(self.config_file):
+            try:
+                mtime = os.path.getmtime(self.config_file)
+            except FileNotFoundError:
                 print(f"⚠️ Configuration file {self.config_file} not found")
                 self.config = {}
                 self.working_proxies = []
                 return
                 
-            with open(self.config_file, 'r') as f:
-                self.config = json.load(f)
-                self.working_proxies = self.config.get('working_proxies', [])
+            self.config = _load_config(self.config_file, mtime)
+            self.working_proxies = self.config.get('working_proxies', [])
                 
             print(f"✅ Loaded configuration with {len(self.working_proxies)} proxies")
             
@@ -67,17 +146,23 @@ class ImprovedProxyChainTester:
         if not ip_string or isinstance(ip_string, str) and "Error" in ip_string:
             return False
         
+        # Fast path: the whole string is a bare address, checked in one C call
+        try:
+            socket.inet_pton(socket.AF_INET, str(ip_string).strip())
+            return True
+        except OSError:
+            pass
+        
         # Extract IP using regex
-        ip_match = re.search(self.test_patterns["ip_pattern"], str(ip_string))
+        ip_match = self.test_patterns["ip_pattern"].search(str(ip_string))
         if not ip_match:
             return False
-            
-        ip = ip_match.group()
-        parts = ip.split('.')
         
+        # inet_pton range-checks every octet in a single C call
         try:
-            return all(0 <= int(part) <= 255 for part in parts)
-        except ValueError:
+            socket.inet_pton(socket.AF_INET, ip_match.group())
+            return True
+        except OSError:
             return False
     
     def extract_ip_from_output(self, output_text):
@@ -85,76 +170,141 @@ class ImprovedProxyChainTester:
         if not output_text:
             return None
             
-        # Try different patterns
-        patterns = [
-            self.test_patterns["current_ip_pattern"],
-            self.test_patterns["origin_pattern"],
-            r'"origin"\s*:\s*"([^"]+)"',  # JSON format
-            r'Current IP:\s*(\S+)',       # Status output
-            r'origin":\s*"([^"]+)"'       # Partial JSON
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, output_text)
-            if match:
-                potential_ip = match.group(1)
-                if self.validate_ip_address(potential_ip):
+        # Single pass; a valid "Current IP:" wins outright, otherwise the first
+        # valid origin field beats the first valid bare address
+        found = {}
+        for match in self.EXTRACT_PATTERN.finditer(output_text):
+            kind = match.lastgroup
+            if kind in found:
+                continue
+            potential_ip = match.group(kind)
+            if self.validate_ip_address(potential_ip):
+                if kind == "current":
                     return potential_ip
+                found[kind] = potential_ip
+        
+        return found.get("origin") or found.get("bare")
+    
+    def _run_in_process(self, command_list, timeout=None):
+        """Run a `python proxy_scanner.py ...` or `python improved_proxy_status.py ...`
+        command by calling the module directly
+        
+        Returns (stdout, stderr, returncode), or None when the command has
+        to go through a subprocess. Raises subprocess.TimeoutExpired if the
+        call overruns `timeout`, as subprocess.run would.
+        """
+        if self.use_subprocess or len(command_list) < 2 or command_list[0] != "python":
+            return None
+        script, argv = command_list[1], command_list[2:]
+        
+        if script == "proxy_scanner.py" and proxy_scanner:
+            return self._call_with_timeout(lambda: proxy_scanner.run(argv), command_list, timeout)
+        
+        if (script == "improved_proxy_status.py" and improved_proxy_status
+                and argv and argv[0] in self.IN_PROCESS_STATUS_ACTIONS):
+            return self._call_with_timeout(lambda: self._run_status(argv), command_list, timeout)
         
-        # Fallback: look for any valid IP in the text
-        ip_match = re.search(self.test_patterns["ip_pattern"], output_text)
-        if ip_match:
-            potential_ip = ip_match.group()
-            if self.validate_ip_address(potential_ip):
-                return potential_ip
-                
         return None
     
+    @staticmethod
+    def _run_status(argv):
+        """In-process `improved_proxy_status.py ARGV...`, as (stdout, stderr, returncode)"""
+        out = io.StringIO()
+        err = io.StringIO()
+        returncode = 0
+        try:
+            improved_proxy_status.main(argv, out=out, err=err)
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception:
+            err.write(traceback.format_exc())
+            returncode = 1
+        return out.getvalue(), err.getvalue(), returncode
+    
+    @staticmethod
+    def _call_with_timeout(call, command_list, timeout):
+        """Run an in-process command on a daemon thread and wait up to `timeout`
+        
+        A call that overruns is abandoned (the daemon thread can't block exit)
+        and reported as subprocess.TimeoutExpired. Calls write to their own
+        out/err buffers, never the process-wide streams, so an abandoned one
+        can't disturb the output of the commands that follow it.
+        """
+        result = []
+        worker = threading.Thread(target=lambda: result.append(call()), daemon=True)
+        worker.start()
+        worker.join(timeout)
+        if worker.is_alive():
+            raise subprocess.TimeoutExpired(command_list, timeout)
+        return result[0]
+    
+    @staticmethod
+    def _clean_output(data):
+        """Strip captured output, decoding bytes without failing on bad UTF-8"""
+        if not data:
+            return ""
+        data = data.strip()
+        if isinstance(data, bytes):
+            return data.decode('utf-8', errors='replace') if data else ""
+        return data
+    
     def run_command_with_validation(self, command_list, timeout=30):
         """Run command with improved output parsing and validation"""
+        # Joined once for the log line and every result dict; shlex.join keeps
+        # arguments with spaces (like curl header options) readable as one
+        cmd_str = shlex.join(command_list)
         try:
-            print(f"🔧 Running: {' '.join(command_list)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"🔧 Running: {cmd_str}")
             
-            result = subprocess.run(
-                command_list,
-                capture_output=True,
-                text=True,
-                timeout=timeout
-            )
+            in_process = self._run_in_process(command_list, timeout)
+            if in_process is not None:
+                stdout, stderr, returncode = in_process
+            else:
+                # Capture raw bytes; they are decoded once below, and only
+                # when there is something left after stripping
+                result = subprocess.run(
+                    command_list,
+                    capture_output=True,
+                    timeout=timeout
+                )
+                stdout, stderr, returncode = result.stdout, result.stderr, result.returncode
             
             # Enhanced result processing
-            stdout_clean = result.stdout.strip() if result.stdout else ""
-            stderr_clean = result.stderr.strip() if result.stderr else ""
+            stdout_clean = self._clean_output(stdout)
+            stderr_clean = self._clean_output(stderr)
             
-            success = result.returncode == 0
+            success = returncode == 0
             
             return {
                 "success": success,
-                "returncode": result.returncode,
+                "returncode": returncode,
                 "stdout": stdout_clean,
                 "stderr": stderr_clean,
-                "command": " ".join(command_list)
+                "command": cmd_str
             }
             
         except subprocess.TimeoutExpired:
             return {
                 "success": False,
                 "error": "timeout",
-                "command": " ".join(command_list),
+                "command": cmd_str,
                 "timeout": timeout
             }
         except Exception as e:
             return {
                 "success": False,
                 "error": str(e),
-                "command": " ".join(command_list)
+                "command": cmd_str
             }
     
     def test_proxy_scanner_directly(self, tool, target, options=""):
         """Test proxy scanner with improved parsing"""
         command = ["python", "proxy_scanner.py", tool, target]
         if options:
-            command.extend(["-o", options])
+            # --options=VALUE keeps argparse from mistaking a value that starts
+            # with "-" for another flag
+            command.append(f"--options={options}")
             
         result = self.run_command_with_validation(command)
         
@@ -178,38 +328,30 @@ class ImprovedProxyChainTester:
         unique_ips = set()
         successful_rotations = 0
         
+        # One scanner call runs every rotation and reports them as a JSON
+        # array on its last line, instead of a process per rotation
+        result = self.run_command_with_validation([
+            "python", "proxy_scanner.py", "batch", "httpbin.org", "--count", "10"
+        ], timeout=300)
+        
+        batch = []
+        if result.get("success") and result.get("stdout"):
+            try:
+                batch = _loads_json(result["stdout"].splitlines()[-1])
+            except ValueError:
+                print("⚠️ Could not parse batch rotation output")
+        
+        # The batch already ran, so collect the per-rotation lines and write
+        # them out in one go
+        lines = []
         for i in range(10):
-            print(f"🎲 Rotation {i+1}/10 ", end="")
-            
-            # Test both the 'test' command and direct curl
-            test_methods = [
-                {"method": "test", "command": ["python", "proxy_scanner.py", "test", "httpbin.org"]},
-                {"method": "curl", "command": ["python", "proxy_scanner.py", "curl", "http://httpbin.org/ip"]}
-            ]
-            
-            rotation_successful = False
-            found_ip = None
-            method_used = None
+            entry = batch[i] if i < len(batch) else {}
+            found_ip = entry.get("ip")
             
-            for test_method in test_methods:
-                try:
-                    result = self.run_command_with_validation(test_method["command"], timeout=30)
-                    
-                    if result.get("success"):
-                        ip = self.extract_ip_from_output(result["stdout"])
-                        if ip and self.validate_ip_address(ip):
-                            unique_ips.add(ip)
-                            found_ip = ip
-                            method_used = test_method["method"]
-                            rotation_successful = True
-                            break
-                            
-                except Exception as e:
-                    print(f"Method {test_method['method']} failed: {e}")
-                    continue
-            
-            if rotation_successful:
-                print(f"- ✅ IP: {found_ip} (via {method_used})")
+            if found_ip and self.validate_ip_address(found_ip):
+                method_used = entry.get("method")
+                unique_ips.add(found_ip)
+                lines.append(f"🎲 Rotation {i+1}/10 - ✅ IP: {found_ip} (via {method_used})")
                 successful_rotations += 1
                 rotation_results.append({
                     "rotation": i+1, 
@@ -218,14 +360,13 @@ class ImprovedProxyChainTester:
                     "method": method_used
                 })
             else:
-                print("- ❌ Failed to get IP")
+                lines.append(f"🎲 Rotation {i+1}/10 - ❌ Failed to get IP")
                 rotation_results.append({
                     "rotation": i+1, 
                     "ip": None, 
                     "success": False
                 })
-            
-            time.sleep(1)  # Brief delay between rotations
+        print("\n".join(lines))
         
         self.results["ip_rotation"] = {
             "total_rotations": 10,
@@ -269,19 +410,30 @@ class ImprovedProxyChainTester:
             }
         ]
         
+        # Compile each test's expected patterns once, ahead of the run loop,
+        # plus one alternation of all of them (group pN is pattern N)
+        for tool_test in tools_to_test:
+            tool_test["compiled_patterns"] = [re.compile(pattern, re.IGNORECASE)
+                                              for pattern in tool_test["expected_patterns"]]
+            tool_test["master_pattern"] = re.compile(
+                "|".join(f"(?P<p{n}>{pattern})"
+                         for n, pattern in enumerate(tool_test["expected_patterns"])),
+                re.IGNORECASE)
+        
         tool_results = []
         successful_integrations = 0
         
         for i, tool_test in enumerate(tools_to_test, 1):
             print(f"\n🔧 Test {i}/{len(tools_to_test)}: {tool_test['description']}")
+            extracted_ip = None
             
             command = ["python", "proxy_scanner.py", tool_test["tool"], tool_test["target"]]
             if tool_test.get("options"):
-                command.extend(["-o", tool_test["options"]])
+                command.append(f"--options={tool_test['options']}")
             
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = self.run_command_with_validation(command, timeout=60)
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             
             # Enhanced success criteria
             success = result.get("success", False)
@@ -289,25 +441,26 @@ class ImprovedProxyChainTester:
             # Check for expected patterns
             patterns_found = 0
             if success and result.get("stdout"):
-                for pattern in tool_test["expected_patterns"]:
-                    if re.search(pattern, result["stdout"], re.IGNORECASE):
-                        patterns_found += 1
+                patterns_found = self._count_patterns(tool_test, result["stdout"])
             
             # Success if command ran and at least one pattern found
             enhanced_success = success and patterns_found > 0
             
+            # One write per tool test rather than one per status line
+            lines = []
             if enhanced_success:
                 successful_integrations += 1
-                print(f"   ✅ Success - {patterns_found}/{len(tool_test['expected_patterns'])} patterns found")
+                lines.append(f"   ✅ Success - {patterns_found}/{len(tool_test['expected_patterns'])} patterns found")
                 
                 # Try to extract IP for additional validation
                 extracted_ip = self.extract_ip_from_output(result["stdout"])
                 if extracted_ip:
-                    print(f"   🎯 Extracted IP: {extracted_ip}")
+                    lines.append(f"   🎯 Extracted IP: {extracted_ip}")
             else:
-                print(f"   ❌ Failed - Return code: {result.get('returncode', 'unknown')}")
+                lines.append(f"   ❌ Failed - Return code: {result.get('returncode', 'unknown')}")
                 if result.get("stderr"):
-                    print(f"   📝 Error: {result['stderr'][:100]}...")
+                    lines.append(f"   📝 Error: {result['stderr'][:100]}...")
+            print("\n".join(lines))
             
             tool_result = {
                 "tool": tool_test["tool"],
@@ -318,9 +471,10 @@ class ImprovedProxyChainTester:
                 "return_code": result.get("returncode"),
                 "patterns_found": patterns_found,
                 "patterns_total": len(tool_test["expected_patterns"]),
-                "stdout_sample": result.get("stdout", "")[:200] if result.get("stdout") else "",
-                "command": " ".join(command)
+                "stdout_sample": result.get("stdout", "")[:200] if result.get("stdout") else ""
             }
+            if tool_test.get("options"):
+                tool_result["options"] = tool_test["options"]
             
             if extracted_ip:
                 tool_result["extracted_ip"] = extracted_ip
@@ -331,6 +485,7 @@ class ImprovedProxyChainTester:
             "total_tools_tested": len(tools_to_test),
             "successful_integrations": successful_integrations,
             "success_rate": round((successful_integrations / len(tools_to_test)) * 100, 2),
+            "command_template": "python proxy_scanner.py <tool> <target> [--options=<options>]",
             "test_details": tool_results
         }
         
@@ -338,6 +493,23 @@ class ImprovedProxyChainTester:
         
         return successful_integrations > 0
     
+    @staticmethod
+    def _count_patterns(tool_test, text):
+        """Count how many of a tool test's expected patterns occur in text
+        
+        One scan with the alternation finds most of them; a pattern it didn't
+        see may only have been hidden by an overlapping match of another one,
+        so those few are confirmed with their own search.
+        """
+        compiled = tool_test["compiled_patterns"]
+        seen = set()
+        for match in tool_test["master_pattern"].finditer(text):
+            seen.add(match.lastgroup)
+            if len(seen) == len(compiled):
+                return len(seen)
+        return len(seen) + sum(1 for n, pattern in enumerate(compiled)
+                               if f"p{n}" not in seen and pattern.search(text))
+    
     def test_daemon_functionality_enhanced(self):
         """Enhanced daemon functionality testing"""
         print("\n🔄 TEST 7: Enhanced Daemon Functionality")
@@ -388,7 +560,7 @@ class ImprovedProxyChainTester:
             health_success = result.get("success", False)
             if health_success and result.get("stdout"):
                 try:
-                    health_data = json.loads(result["stdout"])
+                    health_data = _loads_json(result["stdout"])
                     integrity_healthy = health_data.get("integrity", {}).get("healthy", False)
                     print(f"   {'✅' if integrity_healthy else '⚠️'} System integrity: {integrity_healthy}")
                 except:
@@ -417,14 +589,23 @@ class ImprovedProxyChainTester:
             {"file": "working_proxies.txt", "required": True}
         ]
         
+        # One directory read resolves every file; sizes come from the entries
+        wanted = {config_file["file"] for config_file in config_files}
+        with os.scandir('.') as it:
+            entries = {entry.name: entry for entry in it if entry.name in wanted}
+        
         for config_file in config_files:
-            exists = os.path.exists(config_file["file"])
+            entry = entries.get(config_file["file"])
+            exists = entry is not None
             readable = False
             size_ok = False
             
             if exists:
-                readable = os.access(config_file["file"], os.R_OK)
-                size_ok = os.path.getsize(config_file["file"]) > 0
+                readable = os.access(entry.path, os.R_OK)
+                try:
+                    size_ok = entry.stat().st_size > 0
+                except OSError:
+                    exists = False
             
             file_status = exists and readable and (size_ok or not config_file["required"])
             
@@ -466,9 +647,7 @@ class ImprovedProxyChainTester:
         
         try:
             # Run original tests that work well
-            self.test_basic_connectivity()
-            self.test_performance_metrics()
-            self.test_error_handling()
+            self.run_original_tests()
             
             # Run enhanced tests 
             ip_rotation_ok = self.test_enhanced_ip_rotation()
@@ -507,13 +686,13 @@ class ImprovedProxyChainTester:
         def make_enhanced_request(proxy, request_id):
             """Make a single request through proxy with enhanced validation"""
             try:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 proxy_dict = {
                     'http': f'http://{proxy}',
                     'https': f'http://{proxy}'
                 }
-                response = requests.get('http://httpbin.org/ip', proxies=proxy_dict, timeout=15)
-                duration = time.time() - start_time
+                response = self.session.get('http://httpbin.org/ip', proxies=proxy_dict, timeout=15)
+                duration = time.perf_counter() - start_time
                 
                 if response.status_code == 200:
                     data = response.json()
@@ -547,25 +726,30 @@ class ImprovedProxyChainTester:
         concurrent_count = min(10, len(self.working_proxies) * 3)
         concurrent_results = []
         
+        # Round-robin over the proxies that are still healthy; if none are,
+        # fall back to the full list rather than sending nothing
+        self._seed_proxy_health()
+        healthy = [proxy for proxy in self.working_proxies
+                   if self._proxy_health.get(proxy, 1.0) > self.PROXY_HEALTH_FLOOR]
+        skipped = len(self.working_proxies) - len(healthy)
+        proxy_cycle = itertools.cycle(healthy or self.working_proxies)
+        assignments = [next(proxy_cycle) for _ in range(concurrent_count)]
+        
         print(f"📡 Launching {concurrent_count} concurrent requests...")
+        if skipped and healthy:
+            print(f"   ⏭️ Skipping {skipped} unhealthy proxies")
         
-        with ThreadPoolExecutor(max_workers=3) as executor:
-            futures = []
-            
-            for i in range(concurrent_count):
-                proxy = self.working_proxies[i % len(self.working_proxies)]
-                future = executor.submit(make_enhanced_request, proxy, i+1)
-                futures.append(future)
+        # A worker per request so they all overlap instead of going 3 at a time
+        with ThreadPoolExecutor(max_workers=min(concurrent_count, 32)) as executor:
+            results = executor.map(make_enhanced_request, assignments,
+                                   range(1, concurrent_count + 1))
             
-            for future in as_completed(futures):
-                try:
-                    result = future.result()
-                    if result:
-                        concurrent_results.append(result)
-                        status = "✅" if result.get('success') else "❌"
-                        print(f"   {status} Request {result['request_id']}: {result.get('ip', 'Failed')}")
-                except Exception as e:
-                    print(f"   ❌ Request failed: {e}")
+            for result in results:
+                if result:
+                    self._record_proxy_result(result['proxy'], result.get('success'))
+                    concurrent_results.append(result)
+                    status = "✅" if result.get('success') else "❌"
+                    print(f"   {status} Request {result['request_id']}: {result.get('ip', 'Failed')}")
         
         successful = sum(1 for r in concurrent_results if r and r.get('success'))
         response_times = [r['response_time'] for r in concurrent_results if r and r.get('response_time')]
@@ -584,33 +768,78 @@ class ImprovedProxyChainTester:
         print(f"   ✅ Success Rate: {self.results['stress_tests']['success_rate']}%")
         print(f"   ⚡ Avg Response: {avg_response_time:.2f}s")
     
+    def _seed_proxy_health(self):
+        """Start untracked proxies from their basic connectivity result, if any"""
+        for test in self.results["basic_connectivity"].get("proxy_tests", []):
+            self._proxy_health.setdefault(test["proxy"], 1.0 if test.get("working") else 0.0)
+    
+    def _record_proxy_result(self, proxy, success):
+        """Fold one request outcome into the proxy's health score"""
+        previous = self._proxy_health.get(proxy, 1.0)
+        self._proxy_health[proxy] = ((1 - self.PROXY_HEALTH_WEIGHT) * previous
+                                     + self.PROXY_HEALTH_WEIGHT * (1.0 if success else 0.0))
+    
     # Import the original methods that work well
+    def _original(self, private=False):
+        """Return the shared comprehensive-suite tester, creating it on first use;
+        private=True builds a separate one for a test that mutates its state"""
+        if private or self._original_tester is None:
+            from comprehensive_test_suite import ProxyChainTester
+            tester = ProxyChainTester()
+            if private:
+                tester.working_proxies = self.working_proxies
+                return tester
+            self._original_tester = tester
+        self._original_tester.working_proxies = self.working_proxies
+        return self._original_tester
+    
+    def run_original_tests(self):
+        """Run the three original tests; they are independent and I/O-bound,
+        so unless sequential is set they run concurrently"""
+        tests = (self.test_basic_connectivity,
+                 self.test_performance_metrics,
+                 self.test_error_handling)
+        try:
+            if self.sequential:
+                for test in tests:
+                    test()
+                return
+            
+            # Build the shared tester up front so the workers don't race to create it
+            self._original()
+            with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+                list(executor.map(lambda test: test(), tests))
+        finally:
+            if self._original_tester is not None:
+                self._original_tester.close()
+                self._original_tester = None
+    
     def test_basic_connectivity(self):
         """Use the original basic connectivity test (it works well)"""
-        from comprehensive_test_suite import ProxyChainTester
-        original_tester = ProxyChainTester()
-        original_tester.working_proxies = self.working_proxies
-        original_tester.results = {"basic_connectivity": {}}
+        original_tester = self._original()
+        original_tester.results["basic_connectivity"] = {}
         original_tester.test_basic_connectivity()
         self.results["basic_connectivity"] = original_tester.results["basic_connectivity"]
     
     def test_performance_metrics(self):
         """Use the original performance test (it works well)"""
-        from comprehensive_test_suite import ProxyChainTester
-        original_tester = ProxyChainTester()
-        original_tester.working_proxies = self.working_proxies
-        original_tester.results = {"performance_metrics": {}}
+        original_tester = self._original()
+        original_tester.results["performance_metrics"] = {}
         original_tester.test_performance_metrics()
         self.results["performance_metrics"] = original_tester.results["performance_metrics"]
     
     def test_error_handling(self):
         """Use the original error handling test (it works well)"""
-        from comprehensive_test_suite import ProxyChainTester
-        original_tester = ProxyChainTester()
-        original_tester.working_proxies = self.working_proxies
-        original_tester.results = {"error_handling": {}}
-        original_tester.test_error_handling()
-        self.results["error_handling"] = original_tester.results["error_handling"]
+        # The empty-configuration case swaps out working_proxies, so give it
+        # its own tester when the other tests may be running alongside
+        original_tester = self._original(private=not self.sequential)
+        try:
+            original_tester.results["error_handling"] = {}
+            original_tester.test_error_handling()
+            self.results["error_handling"] = original_tester.results["error_handling"]
+        finally:
+            if original_tester is not self._original_tester:
+                original_tester.close()
     
     def generate_enhanced_report(self):
         """Generate enhanced comprehensive report"""
@@ -681,13 +910,16 @@ class ImprovedProxyChainTester:
             passed_tests += daemon_passed
             print(f"🔄 DAEMON MANAGEMENT: {daemon_passed}/{daemon_total} tests passed ({daemon_rate:.1f}%)")
         
+        # One wall-clock reading stamps both the summary and the report file
+        finished = datetime.now()
+        
         # Overall score
         overall_score = (passed_tests / total_tests * 100) if total_tests > 0 else 0
         self.results["summary"] = {
             "total_tests": total_tests,
             "passed_tests": passed_tests,
             "overall_score": round(overall_score, 1),
-            "test_end_time": datetime.now().isoformat(),
+            "test_end_time": finished.isoformat(),
             "enhanced": True
         }
         
@@ -706,16 +938,34 @@ class ImprovedProxyChainTester:
         print(f"{'='*50}")
         
         # Save detailed report
-        report_file = f"enhanced_test_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-        with open(report_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        report_file = f"enhanced_test_report_{finished.strftime('%Y%m%d_%H%M%S')}.json"
+        if orjson is not None:
+            with open(report_file, 'wb') as f:
+                f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+        else:
+            with open(report_file, 'w') as f:
+                json.dump(self.results, f, indent=2)
         
         print(f"📄 Enhanced detailed report saved to: {report_file}")
         
         return self.results
 
 def main():
-    tester = ImprovedProxyChainTester()
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Enhanced Pr0Xy-chaIN test suite")
+    parser.add_argument('--subprocess', action='store_true',
+                       help='Run scanner/status commands as subprocesses instead of in-process')
+    parser.add_argument('--sequential', action='store_true',
+                       help='Run the original connectivity, performance and error tests one at a time')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Log every scanner/status command as it runs')
+    args = parser.parse_args()
+    
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG, format='%(message)s')
+    
+    tester = ImprovedProxyChainTester(use_subprocess=args.subprocess, sequential=args.sequential)
     results = tester.run_all_enhanced_tests()
     
     if results: